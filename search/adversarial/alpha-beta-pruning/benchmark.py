@@ -0,0 +1,49 @@
+import sys
+import time
+
+import bitboard
+import tictactoe
+
+
+def count_nodes(engine, board) -> int:
+    # Visits the whole game tree below board without any pruning or caching,
+    # so both engines do exactly the same work per node.
+    if engine.terminal(board):
+        engine.utility(board)
+        return 1
+    engine.player(board)
+    return 1 + sum(
+        count_nodes(engine, engine.result(board, action))
+        for action in engine.actions(board)
+    )
+
+
+def time_minimax(engine, board, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        # Both engines keep their positions in the table tictactoe.py owns.
+        tictactoe.transposition_table.clear()
+        engine.minimax(board)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    engines = [
+        ("lists", tictactoe, tictactoe.initial_state()),
+        ("bitboard", bitboard, bitboard.initial_state())
+    ]
+
+    print("%-10s %10s %10s %14s %14s" % (
+        "engine", "nodes", "seconds", "nodes/sec", "minimax ms"))
+    for name, engine, board in engines:
+        start = time.perf_counter()
+        nodes = count_nodes(engine, board)
+        elapsed = time.perf_counter() - start
+        minimax = time_minimax(engine, board, repeat)
+        print("%-10s %10d %10.3f %14.0f %14.2f" % (
+            name, nodes, elapsed, nodes / elapsed, minimax * 1000))
+
+
+if __name__ == "__main__":
+    main()
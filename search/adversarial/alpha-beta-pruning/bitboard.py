@@ -0,0 +1,188 @@
+from typing import List, Optional, Tuple
+
+from tictactoe import (
+    EMPTY,
+    O,
+    SYMMETRIES,
+    X,
+    lookup,
+    store
+)
+
+# A board is a pair of 9-bit masks, the cells taken by X and by O, with cell
+# 3 * i + j at bit 3 * i + j.
+Board = Tuple[int, int]
+
+FULL = 0b111111111
+
+WIN_MASKS = (
+    0b000000111, 0b000111000, 0b111000000,  # rows
+    0b001001001, 0b010010010, 0b100100100,  # columns
+    0b100010001, 0b001010100  # diagonals
+)
+
+# Whether each of the 512 possible masks contains a winning line.
+WINNING = [any(mask & win == win for win in WIN_MASKS) for mask in range(FULL + 1)]
+
+# Every mask under every symmetry, so a board is transformed by two lookups.
+TRANSFORMS = [
+    [
+        sum(1 << k for k, cell in enumerate(symmetry) if mask >> cell & 1)
+        for mask in range(FULL + 1)
+    ]
+    for symmetry in SYMMETRIES
+]
+
+
+def initial_state() -> Board:
+    return 0, 0
+
+
+def player(board: Board) -> str:
+    x, o = board
+    return X if bin(x | o).count("1") % 2 == 0 else O
+
+
+def actions(board: Board) -> List[int]:
+    empty = ~(board[0] | board[1]) & FULL
+    return [cell for cell in range(9) if empty >> cell & 1]
+
+
+def result(board: Board, action: int) -> Board:
+    if not 0 <= action < 9:
+        raise ValueError("Action is out of bounds.")
+    x, o = board
+    bit = 1 << action
+    if (x | o) & bit:
+        raise ValueError("Cell is already occupied.")
+    if bin(x | o).count("1") % 2 == 0:
+        return x | bit, o
+    return x, o | bit
+
+
+def winner(board: Board) -> Optional[str]:
+    x, o = board
+    if WINNING[x]:
+        return X
+    if WINNING[o]:
+        return O
+    return None
+
+
+def terminal(board: Board) -> bool:
+    x, o = board
+    return x | o == FULL or WINNING[x] or WINNING[o]
+
+
+def utility(board: Board) -> int:
+    x, o = board
+    if WINNING[x]:
+        return 1
+    elif WINNING[o]:
+        return -1
+    else:
+        return 0
+
+
+def from_board(board: List[List]) -> Board:
+    x = o = 0
+    for i, row in enumerate(board):
+        for j, cell in enumerate(row):
+            if cell == X:
+                x |= 1 << (3 * i + j)
+            elif cell == O:
+                o |= 1 << (3 * i + j)
+    return x, o
+
+
+def to_board(board: Board) -> List[List]:
+    x, o = board
+    return [
+        [X if x >> (3 * i + j) & 1 else O if o >> (3 * i + j) & 1 else EMPTY
+         for j in range(3)]
+        for i in range(3)
+    ]
+
+
+def from_action(action: Tuple[int, int]) -> int:
+    i, j = action
+    return 3 * i + j
+
+
+def to_action(action: int) -> Tuple[int, int]:
+    return divmod(action, 3)
+
+
+def canonical_key(board: Board) -> int:
+    x, o = board
+    return min(transform[x] << 9 | transform[o] for transform in TRANSFORMS)
+
+
+def best_move(board: List[List]) -> Optional[Tuple[int, int]]:
+    # Drop-in replacement for tictactoe.minimax on a list-of-lists board.
+    action = minimax(from_board(board))
+    return None if action is None else to_action(action)
+
+
+def minimax(board: Board) -> Optional[int]:
+    if winner(board) is not None:
+        return None
+
+    best_action = None
+    if player(board) == X:
+        best_value = float("-inf")
+        alpha = float("-inf")
+        beta = float("inf")
+        for action in actions(board):
+            value = min_value(result(board, action), alpha, beta)
+            if value > best_value:
+                best_value = value
+                best_action = action
+            alpha = max(alpha, best_value)
+    else:
+        best_value = float("inf")
+        alpha = float("-inf")
+        beta = float("inf")
+        for action in actions(board):
+            value = max_value(result(board, action), alpha, beta)
+            if value < best_value:
+                best_value = value
+                best_action = action
+            beta = min(beta, best_value)
+    return best_action
+
+
+def max_value(board: Board, alpha: int, beta: int) -> int:
+    if terminal(board):
+        return utility(board)
+    key = canonical_key(board)
+    value = lookup(key, alpha, beta)
+    if value is not None:
+        return value
+    window = (alpha, beta)
+    value = float("-inf")
+    for action in actions(board):
+        value = max(value, min_value(result(board, action), alpha, beta))
+        if value >= beta:
+            break
+        alpha = max(alpha, value)
+    store(key, value, *window)
+    return value
+
+
+def min_value(board: Board, alpha: int, beta: int) -> int:
+    if terminal(board):
+        return utility(board)
+    key = canonical_key(board)
+    value = lookup(key, alpha, beta)
+    if value is not None:
+        return value
+    window = (alpha, beta)
+    value = float("inf")
+    for action in actions(board):
+        value = min(value, max_value(result(board, action), alpha, beta))
+        if value <= alpha:
+            break
+        beta = min(beta, value)
+    store(key, value, *window)
+    return value
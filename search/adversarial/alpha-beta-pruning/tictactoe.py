@@ -1,9 +1,29 @@
-from typing import List, Set, Tuple, Optional
+from typing import Dict, List, Set, Tuple, Optional, Union
 
 X = "X"
 O = "O"
 EMPTY = None
 
+# The 8 rotations and reflections of the board, as the cell each position of
+# the transformed board is read from, with cells numbered row by row.
+SYMMETRIES = [
+    (0, 1, 2, 3, 4, 5, 6, 7, 8),  # identity
+    (2, 5, 8, 1, 4, 7, 0, 3, 6),  # rotated 90 degrees
+    (8, 7, 6, 5, 4, 3, 2, 1, 0),  # rotated 180 degrees
+    (6, 3, 0, 7, 4, 1, 8, 5, 2),  # rotated 270 degrees
+    (2, 1, 0, 5, 4, 3, 8, 7, 6),  # mirrored left to right
+    (6, 7, 8, 3, 4, 5, 0, 1, 2),  # mirrored top to bottom
+    (0, 3, 6, 1, 4, 7, 2, 5, 8),  # mirrored across the main diagonal
+    (8, 5, 2, 7, 4, 1, 6, 3, 0)  # mirrored across the anti-diagonal
+]
+
+EXACT, LOWER, UPPER = range(3)
+
+# Positions already searched, by canonical key, with their value and whether
+# it is exact or only a lower or upper bound from a cutoff. bitboard.py
+# shares the table, with integer keys.
+transposition_table: Dict[Union[str, int], Tuple[int, int]] = {}
+
 
 def initial_state() -> List[List[None]]:
     return [[EMPTY, EMPTY, EMPTY],
@@ -66,6 +86,13 @@ def utility(board: List[List]) -> int:
         return 0
 
 
+def canonical_key(board: List[List]) -> str:
+    # Symmetric positions have the same value, so they share one entry: the
+    # smallest encoding over all 8 symmetries.
+    cells = [cell or "-" for row in board for cell in row]
+    return min("".join(cells[i] for i in symmetry) for symmetry in SYMMETRIES)
+
+
 def minimax(board: List[List]) -> Tuple[int, int]:
     if winner(board) is not None:
         return None
@@ -96,22 +123,61 @@ def minimax(board: List[List]) -> Tuple[int, int]:
 def max_value(board: List[List], alpha: int, beta: int) -> int:
     if terminal(board):
         return utility(board)
+    key = canonical_key(board)
+    value = lookup(key, alpha, beta)
+    if value is not None:
+        return value
+    window = (alpha, beta)
     value = float("-inf")
     for action in actions(board):
         value = max(value, min_value(result(board, action), alpha, beta))
         if value >= beta:
-            return value
+            break
         alpha = max(alpha, value)
+    store(key, value, *window)
     return value
 
 
 def min_value(board: List[List], alpha: int, beta: int) -> int:
     if terminal(board):
         return utility(board)
+    key = canonical_key(board)
+    value = lookup(key, alpha, beta)
+    if value is not None:
+        return value
+    window = (alpha, beta)
     value = float("inf")
     for action in actions(board):
         value = min(value, max_value(result(board, action), alpha, beta))
         if value <= alpha:
-            return value
+            break
         beta = min(beta, value)
+    store(key, value, *window)
     return value
+
+
+def lookup(key: Union[str, int], alpha: int, beta: int) -> Optional[int]:
+    entry = transposition_table.get(key)
+    if entry is None:
+        return None
+    value, bound = entry
+    # A bound is only usable when it already falls outside the window.
+    if (
+        bound == EXACT or
+        (bound == LOWER and value >= beta) or
+        (bound == UPPER and value <= alpha)
+    ):
+        return value
+    return None
+
+
+def store(key: Union[str, int], value: int, alpha: int, beta: int) -> None:
+    # A value at or below alpha, or at or above beta, came from a cutoff and
+    # only bounds the true value of the position.
+    if value <= alpha:
+        bound = UPPER
+    elif value >= beta:
+        bound = LOWER
+    else:
+        bound = EXACT
+    transposition_table[key] = (value, bound)
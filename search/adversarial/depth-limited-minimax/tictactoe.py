@@ -1,9 +1,26 @@
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 
 X = "X"
 O = "O"
 EMPTY = None
 
+# The 8 rotations and reflections of the board, as the cell each position of
+# the transformed board is read from, with cells numbered row by row.
+SYMMETRIES = [
+    (0, 1, 2, 3, 4, 5, 6, 7, 8),  # identity
+    (2, 5, 8, 1, 4, 7, 0, 3, 6),  # rotated 90 degrees
+    (8, 7, 6, 5, 4, 3, 2, 1, 0),  # rotated 180 degrees
+    (6, 3, 0, 7, 4, 1, 8, 5, 2),  # rotated 270 degrees
+    (2, 1, 0, 5, 4, 3, 8, 7, 6),  # mirrored left to right
+    (6, 7, 8, 3, 4, 5, 0, 1, 2),  # mirrored top to bottom
+    (0, 3, 6, 1, 4, 7, 2, 5, 8),  # mirrored across the main diagonal
+    (8, 5, 2, 7, 4, 1, 6, 3, 0)  # mirrored across the anti-diagonal
+]
+
+# Depth-limited values of positions already searched, by canonical key and
+# remaining depth.
+transposition_table: Dict[Tuple[str, int], int] = {}
+
 
 def initial_state() -> List[List[None]]:
     return [[EMPTY, EMPTY, EMPTY],
@@ -66,6 +83,13 @@ def utility(board: List[List]) -> int:
         return 0
 
 
+def canonical_key(board: List[List]) -> str:
+    # Symmetric positions have the same value, so they share one entry: the
+    # smallest encoding over all 8 symmetries.
+    cells = [cell or "-" for row in board for cell in row]
+    return min("".join(cells[i] for i in symmetry) for symmetry in SYMMETRIES)
+
+
 def minimax(board: List[List]) -> Optional[Tuple[int, int]]:
     if winner(board) is not None:
         return None
@@ -94,16 +118,24 @@ def minimax(board: List[List]) -> Optional[Tuple[int, int]]:
 def max_value(board: List[List], depth: int) -> int:
     if terminal(board) or depth == 0:
         return utility(board)
+    key = (canonical_key(board), depth)
+    if key in transposition_table:
+        return transposition_table[key]
     value = float("-inf")
     for action in actions(board):
         value = max(value, min_value(result(board, action), depth - 1))
+    transposition_table[key] = value
     return value
 
 
 def min_value(board: List[List], depth: int) -> int:
     if terminal(board) or depth == 0:
         return utility(board)
+    key = (canonical_key(board), depth)
+    if key in transposition_table:
+        return transposition_table[key]
     value = float("inf")
     for action in actions(board):
         value = min(value, max_value(result(board, action), depth - 1))
+    transposition_table[key] = value
     return value
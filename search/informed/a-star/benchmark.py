@@ -0,0 +1,102 @@
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import List, Tuple
+from unittest import mock
+
+import maze
+from maze import Maze
+from util import Frontier, Node
+
+
+class ListFrontier(Frontier):
+    def __init__(self, goal: int, width: int):
+        self.goal = goal
+        self.width = width
+        self.frontier: List[Node] = []
+
+    def add(self, node: Node) -> None:
+        if not self.contains_state(node.state):
+            self.frontier.append(node)
+
+    def contains_state(self, state) -> bool:
+        return any(node.state == state for node in self.frontier)
+
+    def empty(self) -> bool:
+        return len(self.frontier) == 0
+
+    def remove(self) -> Node:
+        if self.empty():
+            raise Exception("Empty frontier.")
+        index = min(range(len(self.frontier)), key=self._calculate_total_cost)
+        return self.frontier.pop(index)
+
+    def _calculate_total_cost(self, index: int) -> int:
+        node = self.frontier[index]
+        steps = 0
+        while node.parent is not None:
+            steps += 1
+            node = node.parent
+        return steps + self._manhattan_distance(self.frontier[index])
+
+
+def generate_maze(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    grid = [["#"] * size for _ in range(size)]
+    stack = [(1, 1)]
+    grid[1][1] = " "
+    while stack:
+        row, col = stack[-1]
+        neighbors = [
+            (row + dr, col + dc, row + dr // 2, col + dc // 2)
+            for dr, dc in ((-2, 0), (2, 0), (0, -2), (0, 2))
+            if 0 < row + dr < size - 1 and 0 < col + dc < size - 1 and
+            grid[row + dr][col + dc] == "#"
+        ]
+        if not neighbors:
+            stack.pop()
+            continue
+        next_row, next_col, wall_row, wall_col = rng.choice(neighbors)
+        grid[wall_row][wall_col] = grid[next_row][next_col] = " "
+        stack.append((next_row, next_col))
+    grid[1][1] = "A"
+    grid[size - 2][size - 2] = "B"
+    return "\n".join("".join(row) for row in grid)
+
+
+def measure(filename: str, frontier: type) -> Tuple[int, float]:
+    with mock.patch.object(maze, "Frontier", frontier):
+        solver = Maze(filename)
+        start = time.perf_counter()
+        solver.solve()
+        elapsed = time.perf_counter() - start
+    return solver.num_explored, elapsed
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [21, 41, 81, 161]
+
+    print("%6s %10s %14s %14s %8s" % (
+        "size", "explored", "list pops/s", "heap pops/s", "speedup"))
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            filename = os.path.join(directory, "maze%d.txt" % size)
+            with open(filename, "w") as file:
+                file.write(generate_maze(size))
+
+            list_explored, list_time = measure(filename, ListFrontier)
+            heap_explored, heap_time = measure(filename, Frontier)
+
+            print("%6d %10d %14.0f %14.0f %7.1fx" % (
+                size,
+                heap_explored,
+                list_explored / list_time,
+                heap_explored / heap_time,
+                list_time / heap_time
+            ))
+
+
+if __name__ == "__main__":
+    main()
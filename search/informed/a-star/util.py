@@ -1,7 +1,11 @@
-from typing import List, Optional
+import heapq
+from itertools import count
+from typing import Dict, List, Optional, Tuple
 
 
 class State:
+    __slots__ = ("_items",)
+
     def __init__(self, row: int, column: int):
         self._items = (row, column)
 
@@ -26,68 +30,58 @@ class State:
         return hash(self._items)
 
 
-class Action:
-    def __init__(self, name: str, state: State) -> None:
-        self.name = name
-        self.state = state
-
-    def __iter__(self) -> iter:
-        return iter((self.name, self.state))
-
-
 class Node:
+    __slots__ = ("state", "parent", "action", "cost")
+
     def __init__(
         self,
-        state: State,
+        state: int,
         parent: Optional['Node'],
         action: str
     ) -> None:
         self.state = state
         self.parent = parent
         self.action = action
+        self.cost = 0 if parent is None else parent.cost + 1
 
 
 class Frontier:
-    def __init__(self, goal: State):
+    def __init__(self, goal: int, width: int):
         self.goal = goal
-        self.frontier: List[Node] = []
+        self.width = width
+        self.frontier: List[Tuple[int, int, Node]] = []
+        self.costs: Dict[int, int] = {}
+        self.counter = count()
 
     def add(self, node: Node) -> None:
-        self.frontier.append(node)
+        cost = self.costs.get(node.state)
+        if cost is not None and cost <= node.cost:
+            return
+        # A cheaper path supersedes the queued entry, which is skipped on removal.
+        self.costs[node.state] = node.cost
+        total_cost = node.cost + self._manhattan_distance(node)
+        heapq.heappush(self.frontier, (total_cost, next(self.counter), node))
 
-    def contains_state(self, state) -> None:
-        return any(node.state == state for node in self.frontier)
+    def contains_state(self, state) -> bool:
+        return state in self.costs
 
     def empty(self) -> bool:
-        return len(self.frontier) == 0
+        return len(self.costs) == 0
 
     def remove(self) -> Node:
         if self.empty():
             raise Exception("Empty frontier.")
-        else:
-            return self.frontier.pop(self._index_with_min_cost())
-
-    def _index_with_min_cost(self) -> int:
-        return min(range(self._length()), key=self._calculate_total_cost)
-
-    def _length(self) -> int:
-        return len(self.frontier)
-
-    def _calculate_total_cost(self, index: int) -> int:
-        node = self.frontier[index]
-        g_cost = self._number_of_steps_to_current_node(node)
-        h_cost = self._manhattan_distance(node)
-        return g_cost + h_cost
+        while True:
+            _, _, node = heapq.heappop(self.frontier)
+            if self._is_stale(node):
+                continue
+            del self.costs[node.state]
+            return node
 
-    def _number_of_steps_to_current_node(self, node: Node) -> int:
-        steps = 0
-        current_node = node
-        while current_node.parent is not None:
-            steps += 1
-            current_node = current_node.parent
-        return steps
+    def _is_stale(self, node: Node) -> bool:
+        return self.costs.get(node.state) != node.cost
 
     def _manhattan_distance(self, node: Node) -> int:
-        x2, y2 = self.goal
-        x1, y1 = node.state
+        x2, y2 = divmod(self.goal, self.width)
+        x1, y1 = divmod(node.state, self.width)
         return abs(x2 - x1) + abs(y2 - y1)
@@ -1,7 +1,9 @@
-from typing import List, Optional
+from typing import List, Optional, Set
 
 
 class State:
+    __slots__ = ("_items",)
+
     def __init__(self, row: int, column: int):
         self._items = (row, column)
 
@@ -26,19 +28,12 @@ class State:
         return hash(self._items)
 
 
-class Action:
-    def __init__(self, name: str, state: State) -> None:
-        self.name = name
-        self.state = state
-
-    def __iter__(self) -> iter:
-        return iter((self.name, self.state))
-
-
 class Node:
+    __slots__ = ("state", "parent", "action")
+
     def __init__(
         self,
-        state: State,
+        state: int,
         parent: Optional['Node'],
         action: str
     ) -> None:
@@ -48,15 +43,18 @@ class Node:
 
 
 class Frontier:
-    def __init__(self, goal: State):
+    def __init__(self, goal: int, width: int):
         self.goal = goal
+        self.width = width
         self.frontier: List[Node] = []
+        self.states: Set[int] = set()
 
     def add(self, node: Node) -> None:
         self.frontier.append(node)
+        self.states.add(node.state)
 
-    def contains_state(self, state) -> None:
-        return any(node.state == state for node in self.frontier)
+    def contains_state(self, state) -> bool:
+        return state in self.states
 
     def empty(self) -> bool:
         return len(self.frontier) == 0
@@ -65,7 +63,9 @@ class Frontier:
         if self.empty():
             raise Exception("Empty frontier.")
         else:
-            return self.frontier.pop(self._index_with_min_distance())
+            node = self.frontier.pop(self._index_with_min_distance())
+            self.states.discard(node.state)
+            return node
 
     def _index_with_min_distance(self) -> int:
         return min(range(self._length()), key=self._get_manhattan_distance)
@@ -77,6 +77,6 @@ class Frontier:
         return self._manhattan_distance(self.frontier[index])
 
     def _manhattan_distance(self, node: Node) -> int:
-        x2, y2 = self.goal
-        x1, y1 = node.state
+        x2, y2 = divmod(self.goal, self.width)
+        x1, y1 = divmod(node.state, self.width)
         return abs(x2 - x1) + abs(y2 - y1)
@@ -0,0 +1,112 @@
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+from maze import Maze
+from strategies import STRATEGIES
+
+FIELDS = ["maze", "strategy", "path_length", "num_explored", "seconds", "error"]
+
+
+def find_mazes(patterns: List[str]) -> List[str]:
+    filenames = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, "*.txt")
+        filenames.extend(sorted(glob.glob(pattern)))
+    return filenames
+
+
+def solve(filename: str, strategy: str) -> Dict:
+    summary = dict.fromkeys(FIELDS)
+    summary.update(maze=filename, strategy=strategy)
+    try:
+        maze = Maze(filename)
+        start = time.perf_counter()
+        maze.solve(strategy)
+        summary["seconds"] = round(time.perf_counter() - start, 6)
+    except Exception as error:
+        summary["error"] = str(error)
+        return summary
+
+    summary["num_explored"] = maze.num_explored
+    if maze.path is None:
+        summary["error"] = "No solution."
+    else:
+        summary["path_length"] = len(maze.path)
+    return summary
+
+
+def solve_all(filenames: List[str], strategy: str, workers: int) -> List[Dict]:
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        strategies = [strategy] * len(filenames)
+        chunksize = max(1, len(filenames) // (4 * (workers or os.cpu_count())))
+        return list(executor.map(solve, filenames, strategies, chunksize=chunksize))
+
+
+def write_summary(summaries: List[Dict], output: str) -> None:
+    file = sys.stdout if output == "-" else open(output, "w", newline="")
+    try:
+        if output.endswith(".json"):
+            json.dump(summaries, file, indent=2)
+            file.write("\n")
+        else:
+            writer = csv.DictWriter(file, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(summaries)
+    finally:
+        if file is not sys.stdout:
+            file.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Solve many mazes in parallel.")
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        help="maze .txt files, directories of them, or glob patterns"
+    )
+    parser.add_argument(
+        "--strategy",
+        choices=sorted(STRATEGIES),
+        default="bfs",
+        help="search strategy"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="worker processes (defaults to the number of CPUs)"
+    )
+    parser.add_argument(
+        "--output",
+        default="-",
+        help="summary file, JSON if it ends in .json and CSV otherwise"
+    )
+    args = parser.parse_args()
+
+    filenames = find_mazes(args.paths)
+    if not filenames:
+        sys.exit("No mazes found.")
+
+    start = time.perf_counter()
+    summaries = solve_all(filenames, args.strategy, args.workers)
+    elapsed = time.perf_counter() - start
+
+    write_summary(summaries, args.output)
+    failures = sum(summary["error"] is not None for summary in summaries)
+    print(
+        "Solved %d mazes in %.2f seconds (%d failed)." % (
+            len(summaries) - failures, elapsed, failures),
+        file=sys.stderr
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+import argparse
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Optional, Tuple
+
+from generator import GENERATORS, generate
+from idastar import TABLE_SIZE
+from maze import Maze
+from parallel import CELLS_PER_WORKER
+from strategies import STRATEGIES
+from util import SearchStats
+
+SIZES = [31, 61, 91]
+# Worker scaling needs levels wide enough to be split across the pool, which
+# the small sweep sizes and long backtracker corridors never have.
+SCALING_SIZES = [1001, 2001]
+SCALING_KINDS = ["prim", "rooms"]
+TIMEOUT = 60
+
+
+def measure(
+    filename: str,
+    strategy: str,
+    options: dict
+) -> Tuple[int, Optional[int], float, int, int]:
+    with tempfile.TemporaryDirectory() as cache_directory:
+        maze = Maze(filename)
+        timed_options = cold_options(strategy, options, cache_directory, "timed")
+        start = time.perf_counter()
+        maze.solve(strategy, **timed_options)
+        elapsed = time.perf_counter() - start
+        # Read before tracing starts, which has a large footprint of its own.
+        rss = peak_rss()
+        length = len(maze.path) if maze.path is not None else None
+
+        # A second, traced run on a freshly loaded maze measures the memory the
+        # search allocates from a cold start, without slowing down the timed
+        # run. It must not reuse the planner, distance fields or landmark
+        # tables the timed run left behind.
+        traced = Maze(filename)
+        traced_options = cold_options(strategy, options, cache_directory, "traced")
+        tracemalloc.start()
+        traced.solve(strategy, **traced_options)
+        _, allocated = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return maze.num_explored, length, elapsed, allocated, rss
+
+
+def measure_parallel(
+    filename: str,
+    options: dict
+) -> Tuple[Optional[int], float, int, int]:
+    maze = Maze(filename)
+    stats = SearchStats()
+    start = time.perf_counter()
+    maze.solve("pbfs", stats=stats, **options)
+    elapsed = time.perf_counter() - start
+    length = len(maze.path) if maze.path is not None else None
+    return length, elapsed, stats.parallel_levels, stats.peak_frontier
+
+
+def cold_options(strategy: str, options: dict, cache_directory: str, run: str) -> dict:
+    # Landmark tables saved by an earlier run would otherwise be loaded.
+    if strategy == "alt":
+        return dict(options, cache_directory=os.path.join(cache_directory, run))
+    return options
+
+
+def peak_rss() -> int:
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return usage if sys.platform == "darwin" else usage * 1024
+
+
+def measure_into(connection, function, *args) -> None:
+    connection.send(function(*args))
+
+
+def measure_in_child(timeout: float, function, *args):
+    # A fresh interpreter per run keeps each peak RSS independent, and lets a
+    # run that exceeds the timeout be killed. It is a plain process rather
+    # than a pool worker so that pbfs can start workers of its own.
+    context = multiprocessing.get_context("spawn")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=measure_into,
+        args=(sender, function) + args
+    )
+    process.start()
+    try:
+        return receiver.recv() if receiver.poll(timeout) else None
+    finally:
+        process.terminate()
+        process.join()
+
+
+def sweep(directory: str, args: argparse.Namespace) -> None:
+    print("%-12s %6s %-10s %10s %8s %10s %10s %10s" % (
+        "kind", "size", "strategy", "explored", "length", "seconds",
+        "alloc MB", "RSS MB"))
+    for kind in args.kinds:
+        for size in args.sizes:
+            filename = os.path.join(directory, "%s%d.txt" % (kind, size))
+            with open(filename, "w") as file:
+                file.write(generate(kind, size, seed=args.seed))
+
+            for strategy in args.strategies:
+                options = {"table_size": args.table_size} if strategy == "idastar" else {}
+                measured = measure_in_child(
+                    args.timeout, measure, filename, strategy, options
+                )
+                if measured is None:
+                    print("%-12s %6d %-10s %10s" % (kind, size, strategy, "timeout"))
+                    continue
+                explored, length, elapsed, allocated, rss = measured
+                print("%-12s %6d %-10s %10d %8s %10.4f %10.2f %10.2f" % (
+                    kind, size, strategy, explored, length, elapsed,
+                    allocated / 2 ** 20, rss / 2 ** 20))
+
+
+def scale_workers(directory: str, args: argparse.Namespace) -> None:
+    powers = {2 ** i for i in range(args.workers.bit_length())}
+    counts = sorted({1, args.workers} | powers)
+    print("%-12s %6s %-10s %8s %10s %8s %10s %8s %10s" % (
+        "kind", "size", "strategy", "workers", "seconds", "speedup", "length",
+        "widest", "parallel"))
+    for kind in args.kinds:
+        for size in args.sizes:
+            filename = os.path.join(directory, "%s%d.txt" % (kind, size))
+            with open(filename, "w") as file:
+                file.write(generate(kind, size, seed=args.seed))
+
+            measured = measure_in_child(args.timeout, measure, filename, "bfs", {})
+            if measured is None:
+                print("%-12s %6d %-10s %8d %10s" % (kind, size, "bfs", 1, "timeout"))
+            else:
+                _, length, elapsed, _, _ = measured
+                print("%-12s %6d %-10s %8d %10.4f %8s %10s" % (
+                    kind, size, "bfs", 1, elapsed, "-", length))
+
+            baseline = None
+            for workers in counts:
+                options = {"workers": workers, "threshold": args.threshold}
+                measured = measure_in_child(
+                    args.timeout, measure_parallel, filename, options
+                )
+                if measured is None:
+                    print("%-12s %6d %-10s %8d %10s" % (
+                        kind, size, "pbfs", workers, "timeout"))
+                    continue
+                length, elapsed, parallel_levels, widest = measured
+                if workers == 1:
+                    baseline = elapsed
+                speedup = "%.2f" % (baseline / elapsed) if baseline else "-"
+                print("%-12s %6d %-10s %8d %10.4f %8s %10s %8d %10d" % (
+                    kind, size, "pbfs", workers, elapsed, speedup, length,
+                    widest, parallel_levels))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run search strategies over generated mazes of growing size."
+    )
+    parser.add_argument(
+        "sizes",
+        type=int,
+        nargs="*",
+        help="maze side lengths (default %s, or %s with --workers)" % (
+            " ".join(map(str, SIZES)), " ".join(map(str, SCALING_SIZES)))
+    )
+    parser.add_argument(
+        "--kinds",
+        nargs="+",
+        choices=sorted(GENERATORS),
+        help="maze generators to sweep (default all, or %s with --workers)" % (
+            " ".join(SCALING_KINDS))
+    )
+    parser.add_argument(
+        "--strategies",
+        nargs="+",
+        choices=sorted(STRATEGIES),
+        default=sorted(STRATEGIES),
+        help="strategies to run"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="maze generator seed")
+    parser.add_argument(
+        "--table-size",
+        type=int,
+        default=TABLE_SIZE,
+        help="transposition table entries for idastar"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="instead of the sweep, time pbfs with 1 up to this many workers"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=int,
+        help="smallest level pbfs splits (default %d cells per worker)" % CELLS_PER_WORKER
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=TIMEOUT,
+        help="seconds before a single run is abandoned"
+    )
+    args = parser.parse_args()
+    if not args.sizes:
+        args.sizes = SCALING_SIZES if args.workers else SIZES
+    if not args.kinds:
+        args.kinds = SCALING_KINDS if args.workers else sorted(GENERATORS)
+
+    with tempfile.TemporaryDirectory() as directory:
+        if args.workers:
+            scale_workers(directory, args)
+        else:
+            sweep(directory, args)
+
+
+if __name__ == "__main__":
+    main()
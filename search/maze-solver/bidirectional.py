@@ -0,0 +1,190 @@
+import heapq
+from itertools import count
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from util import Result
+
+OPPOSITE = {"up": "down", "down": "up", "left": "right", "right": "left"}
+
+# Maps a cell to the neighbor it was reached from and the action that links
+# them, always written in the start-to-goal direction.
+Parents = Dict[int, Optional[Tuple[int, str]]]
+
+
+def bidirectional_breadth_first(maze) -> Result:
+    start = maze.index(maze.start)
+    goal = maze.index(maze.goal)
+
+    forward = Side(start)
+    backward = Side(goal, reverse=True)
+
+    if start == goal:
+        return Result(([], []), set(), 0)
+
+    num_explored = 0
+
+    while forward.level and backward.level:
+        if len(forward.level) <= len(backward.level):
+            side, other = forward, backward
+        else:
+            side, other = backward, forward
+
+        num_explored += len(side.level)
+        meeting = side.expand_level(maze, other)
+
+        if meeting is not None:
+            path = join_paths(meeting, forward.parents, backward.parents)
+            return Result(path, forward.explored | backward.explored, num_explored)
+
+    return Result(None, forward.explored | backward.explored, num_explored)
+
+
+def bidirectional_a_star(maze) -> Result:
+    start = maze.index(maze.start)
+    goal = maze.index(maze.goal)
+
+    forward = Side(start, lambda cell: maze.manhattan_distance(cell, goal))
+    backward = Side(
+        goal,
+        lambda cell: maze.manhattan_distance(cell, start),
+        reverse=True
+    )
+
+    best = 0 if start == goal else float("inf")
+    meeting = start if start == goal else None
+    num_explored = 0
+
+    while not forward.empty() and not backward.empty():
+        # With a consistent heuristic no path shorter than the best one found
+        # can remain once either frontier's smallest f reaches it.
+        if forward.min_total_cost() >= best or backward.min_total_cost() >= best:
+            break
+
+        if len(forward.frontier) <= len(backward.frontier):
+            side, other = forward, backward
+        else:
+            side, other = backward, forward
+
+        num_explored += 1
+        for cell, cost in side.expand_best(maze):
+            if cell in other.costs and cost + other.costs[cell] < best:
+                best = cost + other.costs[cell]
+                meeting = cell
+
+    explored = forward.explored | backward.explored
+    if meeting is None:
+        return Result(None, explored, num_explored)
+    return Result(
+        join_paths(meeting, forward.parents, backward.parents),
+        explored,
+        num_explored
+    )
+
+
+class Side:
+    def __init__(
+        self,
+        origin: int,
+        heuristic: Callable[[int], int] = None,
+        reverse: bool = False
+    ) -> None:
+        self.heuristic = heuristic
+        self.reverse = reverse
+        self.parents: Parents = {origin: None}
+        self.costs: Dict[int, int] = {origin: 0}
+        self.explored: Set[int] = set()
+        self.level: List[int] = [origin]
+        self.counter = count()
+        self.frontier: List[Tuple[int, int, int]] = []
+        if heuristic is not None:
+            self._push(origin)
+
+    def expand_level(self, maze, other: 'Side') -> Optional[int]:
+        next_level = []
+        best = meeting = None
+
+        for cell in self.level:
+            self.explored.add(cell)
+            for name, neighbor in maze.neighbors(cell):
+                if neighbor in self.parents:
+                    continue
+                self._link(neighbor, cell, name)
+                self.costs[neighbor] = self.costs[cell] + 1
+                next_level.append(neighbor)
+
+                if neighbor in other.costs:
+                    total = self.costs[neighbor] + other.costs[neighbor]
+                    if best is None or total < best:
+                        best, meeting = total, neighbor
+
+        # Every meeting found while finishing this level is a candidate; the
+        # cheapest of them is a shortest path.
+        self.level = next_level
+        return meeting
+
+    def expand_best(self, maze) -> List[Tuple[int, int]]:
+        self._discard_stale()
+        _, _, cell = heapq.heappop(self.frontier)
+        self.explored.add(cell)
+
+        improved = []
+        cost = self.costs[cell] + 1
+        for name, neighbor in maze.neighbors(cell):
+            if cost < self.costs.get(neighbor, float("inf")):
+                self.costs[neighbor] = cost
+                self._link(neighbor, cell, name)
+                self._push(neighbor)
+                improved.append((neighbor, cost))
+        return improved
+
+    def empty(self) -> bool:
+        self._discard_stale()
+        return len(self.frontier) == 0
+
+    def min_total_cost(self) -> int:
+        self._discard_stale()
+        return self.frontier[0][0]
+
+    def _link(self, neighbor: int, cell: int, name: str) -> None:
+        if self.reverse:
+            self.parents[neighbor] = (cell, OPPOSITE[name])
+        else:
+            self.parents[neighbor] = (cell, name)
+
+    def _push(self, cell: int) -> None:
+        total_cost = self.costs[cell] + self.heuristic(cell)
+        heapq.heappush(self.frontier, (total_cost, next(self.counter), cell))
+
+    def _discard_stale(self) -> None:
+        while self.frontier:
+            total_cost, _, cell = self.frontier[0]
+            is_current = total_cost == self.costs[cell] + self.heuristic(cell)
+            if cell not in self.explored and is_current:
+                return
+            heapq.heappop(self.frontier)
+
+
+def join_paths(
+    meeting: int,
+    forward: Parents,
+    backward: Parents
+) -> Tuple[List[int], List[str]]:
+    cells: List[int] = []
+    actions: List[str] = []
+
+    cell = meeting
+    while forward[cell] is not None:
+        parent, action = forward[cell]
+        cells.append(cell)
+        actions.append(action)
+        cell = parent
+
+    cells.reverse()
+    actions.reverse()
+
+    cell = meeting
+    while backward[cell] is not None:
+        cell, action = backward[cell]
+        cells.append(cell)
+        actions.append(action)
+
+    return cells, actions
@@ -0,0 +1,46 @@
+from typing import Tuple
+
+import numpy as np
+
+UNREACHABLE = -1
+
+
+def distance_field(maze, source: int) -> Tuple[np.ndarray, np.ndarray]:
+    size = maze.height * maze.width
+    open_cells = np.frombuffer(maze.walls, dtype=np.uint8) == 0
+    distances = np.full(size, UNREACHABLE, dtype=np.int32)
+    predecessors = np.full(size, UNREACHABLE, dtype=np.int64)
+
+    if not open_cells[source]:
+        return distances, predecessors
+
+    distances[source] = 0
+    frontier = np.array([source], dtype=np.int64)
+    level = 0
+
+    # Breadth-first search one whole level at a time: every neighbor of the
+    # frontier that is open and unvisited forms the next frontier.
+    while len(frontier):
+        level += 1
+        rows, cols = np.divmod(frontier, maze.width)
+        parents = []
+        children = []
+        for inside, offset in (
+            (rows > 0, -maze.width),
+            (rows < maze.height - 1, maze.width),
+            (cols > 0, -1),
+            (cols < maze.width - 1, 1)
+        ):
+            parents.append(frontier[inside])
+            children.append(frontier[inside] + offset)
+
+        parents = np.concatenate(parents)
+        children = np.concatenate(children)
+        new = open_cells[children] & (distances[children] == UNREACHABLE)
+        parents, children = parents[new], children[new]
+
+        frontier, first = np.unique(children, return_index=True)
+        distances[frontier] = level
+        predecessors[frontier] = parents[first]
+
+    return distances, predecessors
@@ -0,0 +1,188 @@
+import argparse
+import random
+import sys
+from collections import deque
+from typing import Callable, Dict, List, Tuple
+
+Grid = List[List[str]]
+
+DENSITY = 0.25
+ROOM_SIZE = 8
+
+GENERATORS: Dict[str, Callable[[int, int, random.Random], Grid]] = {}
+
+
+def register(name: str) -> Callable:
+    def decorator(generator: Callable) -> Callable:
+        GENERATORS[name] = generator
+        return generator
+    return decorator
+
+
+def corner(size: int) -> int:
+    # Passages run along odd rows and columns, inside the outer wall.
+    return size - 2 if (size - 2) % 2 == 1 else size - 3
+
+
+@register("backtracker")
+def recursive_backtracker(height: int, width: int, rng: random.Random) -> Grid:
+    grid = [["#"] * width for _ in range(height)]
+    stack = [(1, 1)]
+    grid[1][1] = " "
+    while stack:
+        row, col = stack[-1]
+        neighbors = [
+            (row + dr, col + dc, row + dr // 2, col + dc // 2)
+            for dr, dc in ((-2, 0), (2, 0), (0, -2), (0, 2))
+            if 0 < row + dr < height - 1 and 0 < col + dc < width - 1 and
+            grid[row + dr][col + dc] == "#"
+        ]
+        if not neighbors:
+            stack.pop()
+            continue
+        next_row, next_col, wall_row, wall_col = rng.choice(neighbors)
+        grid[wall_row][wall_col] = grid[next_row][next_col] = " "
+        stack.append((next_row, next_col))
+    return grid
+
+
+@register("prim")
+def prim(height: int, width: int, rng: random.Random) -> Grid:
+    grid = [["#"] * width for _ in range(height)]
+    grid[1][1] = " "
+    frontier = []
+
+    def add_frontier(row: int, col: int) -> None:
+        for dr, dc in ((-2, 0), (2, 0), (0, -2), (0, 2)):
+            if (
+                0 < row + dr < height - 1 and 0 < col + dc < width - 1 and
+                grid[row + dr][col + dc] == "#"
+            ):
+                frontier.append((row + dr, col + dc))
+
+    add_frontier(1, 1)
+    while frontier:
+        # Swap a random frontier cell to the end so it can be popped in O(1).
+        i = rng.randrange(len(frontier))
+        frontier[i], frontier[-1] = frontier[-1], frontier[i]
+        row, col = frontier.pop()
+        if grid[row][col] != "#":
+            continue
+        carved = [
+            (row + dr // 2, col + dc // 2)
+            for dr, dc in ((-2, 0), (2, 0), (0, -2), (0, 2))
+            if 0 < row + dr < height - 1 and 0 < col + dc < width - 1 and
+            grid[row + dr][col + dc] == " "
+        ]
+        wall_row, wall_col = rng.choice(carved)
+        grid[wall_row][wall_col] = grid[row][col] = " "
+        add_frontier(row, col)
+    return grid
+
+
+@register("rooms")
+def open_rooms(
+    height: int,
+    width: int,
+    rng: random.Random,
+    room_size: int = ROOM_SIZE,
+    density: float = DENSITY
+) -> Grid:
+    # Redraw until the far corner is reachable; the random stream carries
+    # on between attempts, so the result still depends only on the seed.
+    while True:
+        grid = [["#"] * width for _ in range(height)]
+        for row in range(1, height - 1):
+            for col in range(1, width - 1):
+                on_wall = row % room_size == 0 or col % room_size == 0
+                if not on_wall and rng.random() >= density:
+                    grid[row][col] = " "
+
+        # One door in every wall segment between neighboring rooms, with the
+        # cells on either side cleared so no obstacle blocks it.
+        for row in range(room_size, height - 1, room_size):
+            for col in range(1, width - 1, room_size):
+                door = col + rng.randrange(min(room_size - 1, width - 1 - col))
+                for side in range(row - 1, min(row + 2, height - 1)):
+                    grid[side][door] = " "
+        for col in range(room_size, width - 1, room_size):
+            for row in range(1, height - 1, room_size):
+                door = row + rng.randrange(min(room_size - 1, height - 1 - row))
+                for side in range(col - 1, min(col + 2, width - 1)):
+                    grid[door][side] = " "
+
+        grid[1][1] = grid[corner(height)][corner(width)] = " "
+        if connected(grid, (1, 1), (corner(height), corner(width))):
+            return grid
+
+
+def connected(grid: Grid, start: Tuple[int, int], goal: Tuple[int, int]) -> bool:
+    seen = {start}
+    queue = deque([start])
+    while queue:
+        row, col = queue.popleft()
+        if (row, col) == goal:
+            return True
+        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            cell = (row + dr, col + dc)
+            if (
+                0 <= cell[0] < len(grid) and 0 <= cell[1] < len(grid[0]) and
+                grid[cell[0]][cell[1]] != "#" and cell not in seen
+            ):
+                seen.add(cell)
+                queue.append(cell)
+    return False
+
+
+def generate(kind: str, height: int, width: int = None, seed: int = 0) -> str:
+    if kind not in GENERATORS:
+        raise ValueError("Unknown maze kind: %s" % kind)
+    width = height if width is None else width
+    if height < 5 or width < 5:
+        raise ValueError("Mazes need at least 5 rows and columns.")
+
+    grid = GENERATORS[kind](height, width, random.Random(seed))
+    grid[1][1] = "A"
+    grid[corner(height)][corner(width)] = "B"
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate a maze in the A/B/# text format."
+    )
+    parser.add_argument("height", type=int, help="rows, including the outer wall")
+    parser.add_argument(
+        "width",
+        type=int,
+        nargs="?",
+        help="columns, including the outer wall (defaults to height)"
+    )
+    parser.add_argument(
+        "--kind",
+        choices=sorted(GENERATORS),
+        default="backtracker",
+        help="maze generation algorithm"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument(
+        "--output",
+        default="-",
+        help="maze file to write (defaults to stdout)"
+    )
+    args = parser.parse_args()
+
+    try:
+        maze = generate(args.kind, args.height, args.width, args.seed)
+    except ValueError as error:
+        sys.exit(str(error))
+
+    if args.output == "-":
+        sys.stdout.write(maze)
+    else:
+        with open(args.output, "w") as file:
+            file.write(maze)
+
+
+if __name__ == "__main__":
+    main()
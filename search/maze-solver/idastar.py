@@ -0,0 +1,103 @@
+from typing import Dict, List
+from util import Result
+
+TABLE_SIZE = 100000
+
+
+def iterative_deepening_a_star(maze, table_size: int = TABLE_SIZE) -> Result:
+    start = maze.index(maze.start)
+    goal = maze.index(maze.goal)
+    heuristic = maze.heuristic()
+
+    bound = heuristic(start)
+    num_explored = 0
+
+    while True:
+        search = DepthFirstContour(maze, goal, heuristic, bound, table_size)
+        found = search.run(start)
+        num_explored += search.num_explored
+
+        if found:
+            path = (search.path[1:], search.actions)
+            return Result(path, set(search.table), num_explored)
+        if search.next_bound is None:
+            return Result(None, set(search.table), num_explored)
+
+        bound = search.next_bound
+
+
+class DepthFirstContour:
+    def __init__(
+        self,
+        maze,
+        goal: int,
+        heuristic,
+        bound: int,
+        table_size: int
+    ) -> None:
+        self.maze = maze
+        self.goal = goal
+        self.heuristic = heuristic
+        self.bound = bound
+        self.table_size = table_size
+        # Smallest cost at which each cell was entered during this iteration;
+        # entering it again at no lower cost cannot find anything new.
+        self.table: Dict[int, int] = {}
+        self.next_bound = None
+        self.num_explored = 0
+        self.path: List[int] = []
+        self.actions: List[str] = []
+
+    def run(self, start: int) -> bool:
+        on_path = {start}
+        self.path.append(start)
+        self.num_explored += 1
+        if start == self.goal:
+            return True
+
+        stack = [iter(self.maze.neighbors(start))]
+        while stack:
+            step = next(stack[-1], None)
+            if step is None:
+                stack.pop()
+                on_path.discard(self.path.pop())
+                if self.actions:
+                    self.actions.pop()
+                continue
+
+            name, cell = step
+            cost = len(self.path)
+            if cell in on_path or not self._within_bound(cell, cost):
+                continue
+            if not self._record(cell, cost):
+                continue
+
+            self.path.append(cell)
+            self.actions.append(name)
+            on_path.add(cell)
+            self.num_explored += 1
+
+            if cell == self.goal:
+                return True
+
+            stack.append(iter(self.maze.neighbors(cell)))
+
+        return False
+
+    def _within_bound(self, cell: int, cost: int) -> bool:
+        total_cost = cost + self.heuristic(cell)
+        if total_cost <= self.bound:
+            return True
+        if self.next_bound is None or total_cost < self.next_bound:
+            self.next_bound = total_cost
+        return False
+
+    def _record(self, cell: int, cost: int) -> bool:
+        if self.table_size <= 0:
+            return True
+        previous = self.table.get(cell)
+        if previous is not None and previous <= cost:
+            return False
+        if previous is not None or len(self.table) < self.table_size:
+            self.table[cell] = cost
+        return True
@@ -0,0 +1,141 @@
+from typing import List, Optional, Tuple
+from util import Node, PriorityFrontier, Result
+
+DIRECTIONS = {
+    "up": (-1, 0),
+    "down": (1, 0),
+    "left": (0, -1),
+    "right": (0, 1)
+}
+
+
+def jump_point_search(maze) -> Result:
+    start = maze.index(maze.start)
+    goal = maze.index(maze.goal)
+    search = JumpPointSearch(maze, goal)
+
+    frontier = PriorityFrontier(maze.heuristic())
+    frontier.add(Node(state=start, parent=None, action=None))
+
+    explored = set()
+    num_explored = 0
+
+    while not frontier.empty():
+        node = frontier.remove()
+        num_explored += 1
+
+        if node.state == goal:
+            return Result(search.expand_path(node), explored, num_explored)
+
+        explored.add(node.state)
+
+        for name, jump_point, distance in search.successors(node):
+            if jump_point not in explored:
+                child = Node(
+                    state=jump_point,
+                    parent=node,
+                    action=name,
+                    step_cost=distance
+                )
+                frontier.add(child)
+
+    return Result(None, explored, num_explored)
+
+
+class JumpPointSearch:
+    def __init__(self, maze, goal: int) -> None:
+        self.maze = maze
+        self.goal = divmod(goal, maze.width)
+
+    def successors(self, node: Node) -> List[Tuple[str, int, int]]:
+        row, col = divmod(node.state, self.maze.width)
+        successors = []
+        for name in self._pruned_directions(node):
+            jump_point = self._jump(row, col, *DIRECTIONS[name])
+            if jump_point is not None:
+                jump_row, jump_col = jump_point
+                distance = abs(jump_row - row) + abs(jump_col - col)
+                index = jump_row * self.maze.width + jump_col
+                successors.append((name, index, distance))
+        return successors
+
+    def expand_path(self, node: Node) -> Tuple[List[int], List[str]]:
+        cells: List[int] = []
+        actions: List[str] = []
+
+        while node.parent is not None:
+            row, col = divmod(node.state, self.maze.width)
+            d_row, d_col = DIRECTIONS[node.action]
+            for _ in range(node.cost - node.parent.cost):
+                cells.append(row * self.maze.width + col)
+                actions.append(node.action)
+                row, col = row - d_row, col - d_col
+            node = node.parent
+
+        cells.reverse()
+        actions.reverse()
+        return cells, actions
+
+    def _pruned_directions(self, node: Node) -> List[str]:
+        if node.parent is None:
+            return list(DIRECTIONS)
+
+        row, col = divmod(node.state, self.maze.width)
+        _, d_col = DIRECTIONS[node.action]
+        if d_col != 0:
+            candidates = ("up", "down", node.action)
+        else:
+            candidates = ("left", "right", node.action)
+
+        return [
+            name for name in candidates
+            if self._walkable(row + DIRECTIONS[name][0], col + DIRECTIONS[name][1])
+        ]
+
+    def _jump(
+        self,
+        row: int,
+        col: int,
+        d_row: int,
+        d_col: int
+    ) -> Optional[Tuple[int, int]]:
+        while True:
+            row, col = row + d_row, col + d_col
+            if not self._walkable(row, col):
+                return None
+            if (row, col) == self.goal:
+                return row, col
+            if self._has_forced_neighbor(row, col, d_row, d_col):
+                return row, col
+            if d_row != 0:
+                # Moving vertically, a cell is also a jump point when a
+                # horizontal jump from it reaches one.
+                if self._jump_horizontally(row, col):
+                    return row, col
+
+    def _jump_horizontally(self, row: int, col: int) -> bool:
+        return (
+            self._jump(row, col, 0, 1) is not None or
+            self._jump(row, col, 0, -1) is not None
+        )
+
+    def _has_forced_neighbor(
+        self,
+        row: int,
+        col: int,
+        d_row: int,
+        d_col: int
+    ) -> bool:
+        # An open side cell whose counterpart one step back is blocked can
+        # only be reached optimally through this cell.
+        for sign in (-1, 1):
+            side_row, side_col = row + sign * d_col, col + sign * d_row
+            behind = self._walkable(side_row - d_row, side_col - d_col)
+            if self._walkable(side_row, side_col) and not behind:
+                return True
+        return False
+
+    def _walkable(self, row: int, col: int) -> bool:
+        maze = self.maze
+        inside = 0 <= row < maze.height and 0 <= col < maze.width
+        return inside and not maze.walls[row * maze.width + col]
@@ -0,0 +1,72 @@
+import os
+from typing import Callable, List
+
+import numpy as np
+from distances import UNREACHABLE, distance_field
+
+LANDMARKS = 8
+CACHE_DIRECTORY = ".landmarks"
+
+
+def landmark_distances(maze, landmarks: int, cache_directory: str) -> np.ndarray:
+    # Returns the tables as (cells, landmarks), so the distances from every
+    # landmark to one cell are a single contiguous row.
+    key = (maze.digest(), landmarks)
+    if maze.landmark_cache is not None and maze.landmark_cache[0] == key:
+        return maze.landmark_cache[1]
+
+    filename = os.path.join(cache_directory, "%s-%d.npy" % key)
+    if os.path.exists(filename):
+        tables = np.load(filename)
+    else:
+        tables = select_landmarks(maze, landmarks)
+        os.makedirs(cache_directory, exist_ok=True)
+        np.save(filename, tables)
+
+    tables = np.ascontiguousarray(tables.T)
+    maze.landmark_cache = (key, tables)
+    return tables
+
+
+def select_landmarks(maze, landmarks: int) -> np.ndarray:
+    open_cells = np.flatnonzero(np.frombuffer(maze.walls, dtype=np.uint8) == 0)
+    if len(open_cells) == 0:
+        return np.empty((0, maze.height * maze.width), dtype=np.int32)
+
+    # Farthest-point selection: each landmark is the reachable cell farthest
+    # from every landmark chosen before it.
+    seed, _ = distance_field(maze, int(open_cells[0]))
+    nearest = np.where(seed == UNREACHABLE, -1, seed)
+    tables: List[np.ndarray] = []
+    for _ in range(landmarks):
+        landmark = int(np.argmax(nearest))
+        if nearest[landmark] <= 0 and tables:
+            break
+        table, _ = distance_field(maze, landmark)
+        tables.append(table)
+        nearest = np.minimum(nearest, np.where(table == UNREACHABLE, -1, table))
+
+    return np.stack(tables)
+
+
+def alt_heuristic(maze, tables: np.ndarray) -> Callable[[int], int]:
+    goal = maze.index(maze.goal)
+    manhattan = maze.heuristic()
+
+    to_goal = tables[goal]
+    usable = np.flatnonzero(to_goal != UNREACHABLE)
+    if len(usable) == 0:
+        return manhattan
+    to_goal = to_goal[usable]
+
+    # By the triangle inequality |d(L, goal) - d(L, n)| never exceeds the
+    # distance from n to the goal, for every landmark L. The bound is only
+    # computed for the cells the search reaches, so a short query does not
+    # pay for the whole grid.
+    def heuristic(cell: int) -> int:
+        to_cell = tables[cell, usable]
+        bounds = np.abs(to_cell - to_goal)
+        bounds[to_cell == UNREACHABLE] = 0
+        return max(int(bounds.max()), manhattan(cell))
+
+    return heuristic
@@ -0,0 +1,145 @@
+import heapq
+import math
+from typing import Dict, Iterable, List, Set, Tuple
+from bidirectional import OPPOSITE
+from util import Result
+
+Key = Tuple[float, float]
+
+
+def lifelong_a_star(maze) -> Result:
+    planner = maze.planner
+    start = maze.index(maze.start)
+    goal = maze.index(maze.goal)
+    if planner is None or (planner.start, planner.goal) != (start, goal):
+        planner = maze.planner = LifelongPlanner(maze, start, goal)
+    return planner.plan()
+
+
+class LifelongPlanner:
+    """Lifelong Planning A* between fixed endpoints.
+
+    g holds the cost of the best path found so far to each cell and rhs the
+    one-step lookahead from its neighbors' g values. A cell is consistent
+    when the two agree; only inconsistent cells are queued. After wall
+    edits, update_cells marks the affected cells inconsistent, and plan()
+    re-expands just those whose cost change can reach the goal.
+    """
+
+    def __init__(self, maze, start: int, goal: int) -> None:
+        self.maze = maze
+        self.start = start
+        self.goal = goal
+        self.heuristic = maze.heuristic()
+
+        size = maze.height * maze.width
+        self.g: List[float] = [math.inf] * size
+        self.rhs: List[float] = [math.inf] * size
+        self.rhs[start] = 0
+
+        # Heap entries are only valid while they match the key in self.keys.
+        self.queue: List[Tuple[Key, int]] = []
+        self.keys: Dict[int, Key] = {}
+        self._push(start)
+
+    def update_cells(self, cells: Iterable[int]) -> None:
+        # Toggling a wall changes the cost of entering it and the paths that
+        # leave it, so the cell and its neighbors need new lookaheads.
+        affected = set()
+        for cell in cells:
+            affected.add(cell)
+            affected.update(self._adjacent(cell))
+        for cell in affected:
+            self._update(cell)
+
+    def plan(self) -> Result:
+        expanded: Set[int] = set()
+        num_explored = 0
+
+        while True:
+            top = self._top()
+            if top is None:
+                break
+            key, cell = top
+            goal = self.goal
+            if key >= self._key(goal) and self.rhs[goal] == self.g[goal]:
+                break
+
+            heapq.heappop(self.queue)
+            del self.keys[cell]
+            num_explored += 1
+            expanded.add(cell)
+
+            if self.g[cell] > self.rhs[cell]:
+                self.g[cell] = self.rhs[cell]
+            else:
+                self.g[cell] = math.inf
+                self._update(cell)
+            for _, neighbor in self.maze.neighbors(cell):
+                self._update(neighbor)
+
+        return Result(self._path(), expanded, num_explored)
+
+    def _path(self):
+        if self.g[self.goal] == math.inf:
+            return None
+
+        cells: List[int] = []
+        actions: List[str] = []
+        cell = self.goal
+        while cell != self.start:
+            cells.append(cell)
+            name, cell = min(
+                self.maze.neighbors(cell),
+                key=lambda neighbor: self.g[neighbor[1]]
+            )
+            actions.append(OPPOSITE[name])
+
+        cells.reverse()
+        actions.reverse()
+        return cells, actions
+
+    def _update(self, cell: int) -> None:
+        if cell != self.start:
+            if self.maze.walls[cell]:
+                self.rhs[cell] = math.inf
+            else:
+                cost = self.maze.cost(cell)
+                self.rhs[cell] = min(
+                    (
+                        self.g[neighbor] + cost
+                        for _, neighbor in self.maze.neighbors(cell)
+                    ),
+                    default=math.inf
+                )
+        self.keys.pop(cell, None)
+        if self.g[cell] != self.rhs[cell]:
+            self._push(cell)
+
+    def _push(self, cell: int) -> None:
+        key = self._key(cell)
+        self.keys[cell] = key
+        heapq.heappush(self.queue, (key, cell))
+
+    def _top(self):
+        # Drops superseded heap entries before returning the smallest key.
+        while self.queue:
+            key, cell = self.queue[0]
+            if self.keys.get(cell) == key:
+                return key, cell
+            heapq.heappop(self.queue)
+        return None
+
+    def _key(self, cell: int) -> Key:
+        best = min(self.g[cell], self.rhs[cell])
+        return best + self.heuristic(cell), best
+
+    def _adjacent(self, cell: int) -> List[int]:
+        row, col = divmod(cell, self.maze.width)
+        width = self.maze.width
+        inside = (row > 0, row < self.maze.height - 1, col > 0, col < width - 1)
+        return [
+            cell + offset
+            for (_, offset), is_inside in zip(self.maze.offsets, inside)
+            if is_inside
+        ]
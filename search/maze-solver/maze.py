@@ -0,0 +1,598 @@
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import sys
+import time
+import numpy as np
+from PIL import Image
+from distances import UNREACHABLE, distance_field
+from idastar import TABLE_SIZE
+from landmarks import LANDMARKS
+from parallel import CELLS_PER_WORKER, WORKERS
+from strategies import (
+    INSTRUMENTED_STRATEGIES,
+    STRATEGIES,
+    UNIT_COST_STRATEGIES,
+    WEIGHT
+)
+from util import SearchStats, State
+from typing import (
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple
+)
+
+
+# Maps "#" to 1 and every other byte to 0; maze files hold one byte per cell.
+WALL_TABLE = bytes(int(byte == ord("#")) for byte in range(256))
+# Maps the digits "1" to "9" to the cost of entering the cell; any other
+# open cell costs 1.
+COST_TABLE = bytes(
+    byte - ord("0") if ord("1") <= byte <= ord("9") else 1
+    for byte in range(256)
+)
+
+OPEN, WALL, START, GOAL, SOLUTION, EXPLORED = range(6)
+
+BLACK = (0, 0, 0, 255)
+PALETTE = np.array([
+    (237, 240, 252, 255),  # RGB: Pale Blue
+    (40, 40, 40, 255),  # RGB: Ebony
+    (255, 0, 0, 255),  # RGB: Red
+    (0, 171, 28, 255),  # RGB: Green
+    (220, 235, 113, 255),  # RGB: Light Olive Green
+    (212, 97, 85, 255)  # RGB: Coral Red
+], dtype=np.uint8)
+
+# Characters for each cell class in printed mazes, as code points; explored
+# cells print as open ones.
+GLYPHS = np.array([ord(char) for char in " █AB* "], dtype=np.uint32)
+# Rows joined into each write when printing.
+PRINT_ROWS = 256
+
+# Pixels per cell in images, and the longest side the default cell size keeps
+# images within, so large mazes render at a few pixels per cell.
+CELL_SIZE = 50
+IMAGE_SIZE = 2000
+
+# Distance field gradient endpoints.
+NEAR = np.array((255, 241, 118, 255), dtype=float)  # RGB: Pale Yellow
+FAR = np.array((33, 102, 172, 255), dtype=float)  # RGB: Denim Blue
+
+
+class Maze:
+    def __init__(self, filename: str, use_mmap: bool = False) -> None:
+        self._load_maze(filename, use_mmap)
+
+    def _load_maze(self, filename: str, use_mmap: bool) -> None:
+        start, goals, walls, costs, height, width = self._read(filename, use_mmap)
+
+        self.height: int = height
+        self.width: int = width
+        self.offsets: Tuple[Tuple[str, int], ...] = (
+            ("up", -width),
+            ("down", width),
+            ("left", -1),
+            ("right", 1)
+        )
+
+        self.start: State = start
+        # Every goal cell in reading order. Single-goal strategies search for
+        # the first; nearest and tour use them all.
+        self.goals: List[State] = goals
+        self.goal: State = goals[0]
+        self.walls: bytearray = walls
+        # Per-cell entry costs, or None when every step costs 1.
+        self.costs: Optional[bytearray] = costs
+
+        # Cells on the solution path in order, excluding the start, and a
+        # per-cell mask of explored states.
+        self.path: Optional[np.ndarray] = None
+        self.actions: Optional[List[str]] = None
+        self.explored: Optional[np.ndarray] = None
+        self.num_explored: int = 0
+        self.landmark_cache: Optional[Tuple] = None
+        # Hash of the wall grid, computed on first use and dropped whenever
+        # the walls change.
+        self._digest: Optional[str] = None
+        # Wall digest and the distance fields computed from each source cell
+        # under it, shared by waypoint tours.
+        self.distance_cache: Optional[Tuple[str, Dict]] = None
+        # Search state kept by lpastar between solves, repaired by toggle_walls.
+        self.planner = None
+
+    def _read(self, filename: str, use_mmap: bool) -> Tuple:
+        with open(filename, "rb") as file:
+            return self._parse(self._lines(file, use_mmap))
+
+    def _lines(self, file: BinaryIO, use_mmap: bool) -> Iterator[bytes]:
+        if not use_mmap:
+            yield from file
+        elif os.fstat(file.fileno()).st_size > 0:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield from iter(mapped.readline, b"")
+
+    def _parse(self, lines: Iterable[bytes]) -> Tuple:
+        walls = bytearray()
+        costs = None
+        height = width = 0
+        starts = 0
+        start = None
+        goals: List[State] = []
+
+        for line in lines:
+            line = line.rstrip(b"\r\n")
+            if b"A" in line:
+                starts += line.count(b"A")
+                start = State(height, line.index(b"A"))
+            column = line.find(b"B")
+            while column != -1:
+                goals.append(State(height, column))
+                column = line.find(b"B", column + 1)
+
+            line_costs = line.translate(COST_TABLE)
+            if costs is None and line and max(line_costs) > 1:
+                # Costs are only stored once the first weighted cell appears.
+                costs = bytearray(b"\x01") * len(walls)
+
+            if len(line) > width:
+                walls = self._widen(walls, height, width, len(line))
+                if costs is not None:
+                    costs = self._widen(costs, height, width, len(line), 1)
+                width = len(line)
+            walls += line.translate(WALL_TABLE)
+            walls += bytes(width - len(line))
+            if costs is not None:
+                costs += line_costs
+                costs += b"\x01" * (width - len(line))
+            height += 1
+
+        self._validate(height, starts, len(goals))
+        return start, goals, walls, costs, height, width
+
+    def _widen(
+        self,
+        walls: bytearray,
+        height: int,
+        width: int,
+        new_width: int,
+        fill: int = 0
+    ) -> bytearray:
+        widened = bytearray([fill]) * (height * new_width)
+        for i in range(height):
+            row = walls[i * width:(i + 1) * width]
+            widened[i * new_width:i * new_width + width] = row
+        return widened
+
+    def _validate(self, height: int, starts: int, goals: int) -> None:
+        if height == 0:
+            raise Exception("Invalid maze.")
+        if starts != 1:
+            raise Exception("Maze must have exactly one start point.")
+        if goals == 0:
+            raise Exception("Maze must have at least one goal.")
+
+    def digest(self) -> str:
+        if self._digest is None:
+            digest = hashlib.sha256(b"%d:%d:" % (self.height, self.width))
+            digest.update(self.walls)
+            self._digest = digest.hexdigest()[:16]
+        return self._digest
+
+    def set_endpoints(
+        self,
+        start: State,
+        goal: State,
+        goals: Optional[List[State]] = None
+    ) -> None:
+        goals = [goal] if goals is None else goals
+        for state in [start, goal] + goals:
+            row, col = state
+            inside = 0 <= row < self.height and 0 <= col < self.width
+            if not inside or self.walls[self.index(state)]:
+                raise ValueError("Endpoint is not an open cell: %s" % (state,))
+        self.start = start
+        self.goal = goal
+        self.goals = goals
+
+    def toggle_walls(self, states: Iterable[State]) -> None:
+        cells = []
+        for state in states:
+            row, col = state
+            if not (0 <= row < self.height and 0 <= col < self.width):
+                raise ValueError("Cell is outside the maze: %s" % (state,))
+            if state == self.start or state in self.goals:
+                raise ValueError("Cannot put a wall on an endpoint: %s" % (state,))
+            cells.append(self.index(state))
+
+        for cell in cells:
+            self.walls[cell] ^= 1
+        self._digest = None
+        if self.planner is not None:
+            self.planner.update_cells(cells)
+
+        # The previous solution may run through a new wall.
+        self.path = self.actions = self.explored = None
+        self.num_explored = 0
+
+    @property
+    def weighted(self) -> bool:
+        return self.costs is not None
+
+    def cost(self, index: int) -> int:
+        return 1 if self.costs is None else self.costs[index]
+
+    def path_cost(self) -> Optional[int]:
+        if self.path is None:
+            return None
+        if self.costs is None:
+            return len(self.path)
+        costs = np.frombuffer(self.costs, dtype=np.uint8)
+        return int(costs[self.path].sum())
+
+    def index(self, state: State) -> int:
+        row, col = state
+        return row * self.width + col
+
+    def state(self, index: int) -> State:
+        return State(*divmod(index, self.width))
+
+    def manhattan_distance(self, index1: int, index2: int) -> int:
+        row1, col1 = divmod(index1, self.width)
+        row2, col2 = divmod(index2, self.width)
+        return abs(row1 - row2) + abs(col1 - col2)
+
+    def heuristic(self) -> Callable[[int], int]:
+        goal = self.index(self.goal)
+        return lambda index: self.manhattan_distance(index, goal)
+
+    def solve(
+        self,
+        strategy: str = "bfs",
+        stats: Optional[SearchStats] = None,
+        **options
+    ) -> None:
+        if strategy not in STRATEGIES:
+            raise ValueError("Unknown strategy: %s" % strategy)
+        if self.weighted and strategy in UNIT_COST_STRATEGIES:
+            raise ValueError("Strategy %s needs a maze without costs." % strategy)
+
+        if stats is None:
+            result = STRATEGIES[strategy](self, **options)
+        else:
+            if strategy in INSTRUMENTED_STRATEGIES:
+                options["stats"] = stats
+            start = time.perf_counter()
+            result = STRATEGIES[strategy](self, **options)
+            stats.total_seconds = time.perf_counter() - start
+            stats.strategy = strategy
+            stats.expanded = result.num_explored
+
+        self.explored = self._mask(result.explored)
+        self.num_explored = result.num_explored
+        if result.path is None:
+            self.path = self.actions = None
+        else:
+            cells, self.actions = result.path
+            self.path = np.array(cells, dtype=np.intp)
+
+    @property
+    def solution(self) -> Optional[Tuple[List[State], List[str]]]:
+        if self.path is None:
+            return None
+        return [self.state(cell) for cell in self.path.tolist()], self.actions
+
+    def _mask(self, cells: Iterable[int]) -> np.ndarray:
+        mask = np.zeros(self.height * self.width, dtype=bool)
+        if not isinstance(cells, np.ndarray):
+            cells = np.fromiter(cells, dtype=np.intp, count=len(cells))
+        mask[cells] = True
+        return mask
+
+    def export(self, filename: str) -> None:
+        if self.explored is None:
+            raise Exception("Maze has not been solved.")
+        path = self.path if self.path is not None else np.empty(0, np.intp)
+        np.savez_compressed(
+            filename,
+            shape=np.array([self.height, self.width]),
+            path=path.astype(np.int64),
+            explored=np.packbits(self.explored)
+        )
+
+    def neighbors(self, index: int) -> List[Tuple[str, int]]:
+        row, col = divmod(index, self.width)
+        inside = (row > 0, row < self.height - 1, col > 0, col < self.width - 1)
+        return [
+            (name, index + offset)
+            for (name, offset), is_inside in zip(self.offsets, inside)
+            if is_inside and not self.walls[index + offset]
+        ]
+
+    def print(self, file: Optional[TextIO] = None) -> None:
+        file = sys.stdout if file is None else file
+        classes = self.cell_classes()
+        costs = None
+        if self.costs is not None:
+            costs = np.frombuffer(self.costs, dtype=np.uint8).reshape(classes.shape)
+
+        # Only PRINT_ROWS rows are turned into strings at a time, so very large
+        # grids stream out without a copy of the whole text in memory.
+        file.write("\n")
+        for begin in range(0, self.height, PRINT_ROWS):
+            block = classes[begin:begin + PRINT_ROWS]
+            codes = GLYPHS[block]
+            if costs is not None:
+                block_costs = costs[begin:begin + PRINT_ROWS]
+                weighted = (block == OPEN) & (block_costs > 1)
+                codes[weighted] = ord("0") + block_costs[weighted]
+            # Each row of code points reinterpreted as one fixed-width string.
+            rows = codes.view("U%d" % self.width).ravel().tolist()
+            file.write("\n".join(rows) + "\n")
+        file.write("\n")
+        file.flush()
+
+    def output_image(
+        self,
+        filename: str,
+        show_solution=True,
+        show_explored=False,
+        cell_size: Optional[int] = None
+    ):
+        classes = self.cell_classes(show_solution, show_explored)
+        self._save_cells(filename, PALETTE[classes], cell_size)
+
+    def output_distance_image(
+        self,
+        filename: str,
+        distances: np.ndarray,
+        cell_size: Optional[int] = None
+    ):
+        distances = distances.reshape(self.height, self.width)
+        reachable = distances != UNREACHABLE
+        farthest = max(int(distances.max()), 1)
+
+        # Shade reachable cells from near to far, then mark walls and the
+        # source on top.
+        ratio = (distances / farthest)[..., np.newaxis]
+        colors = np.rint(NEAR + (FAR - NEAR) * ratio).astype(np.uint8)
+        colors[~reachable] = PALETTE[OPEN]
+        colors[distances == 0] = PALETTE[START]
+        walls = np.frombuffer(self.walls, dtype=np.uint8).reshape(colors.shape[:2])
+        colors[walls.astype(bool)] = PALETTE[WALL]
+
+        self._save_cells(filename, colors, cell_size)
+
+    def default_cell_size(self) -> int:
+        return max(1, min(CELL_SIZE, IMAGE_SIZE // max(self.height, self.width)))
+
+    def _save_cells(
+        self,
+        filename: str,
+        colors: np.ndarray,
+        cell_size: Optional[int]
+    ):
+        if cell_size is None:
+            cell_size = self.default_cell_size()
+        cell_border = cell_size // 25
+        pixels = colors.repeat(cell_size, axis=0).repeat(cell_size, axis=1)
+
+        # Each cell is filled from cell_border to cell_size - cell_border
+        # inclusive; the remaining rows and columns form the black grid.
+        offsets = np.arange(cell_size)
+        inside = (offsets >= cell_border) & (offsets <= cell_size - cell_border)
+        pixels[~np.tile(inside, self.height), :] = BLACK
+        pixels[:, ~np.tile(inside, self.width)] = BLACK
+
+        Image.fromarray(pixels, "RGBA").save(filename)
+
+    def distance_field(
+        self,
+        source: Optional[State] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        source = self.index(source if source is not None else self.start)
+        distances, predecessors = distance_field(self, source)
+        shape = (self.height, self.width)
+        return distances.reshape(shape), predecessors.reshape(shape)
+
+    def cell_classes(self, show_solution=True, show_explored=False) -> np.ndarray:
+        classes = np.full(self.height * self.width, OPEN, dtype=np.uint8)
+        if show_explored and self.explored is not None:
+            classes[self.explored] = EXPLORED
+        if show_solution and self.path is not None:
+            classes[self.path] = SOLUTION
+        classes[[self.index(goal) for goal in self.goals]] = GOAL
+        classes[self.index(self.start)] = START
+        classes[np.frombuffer(self.walls, dtype=np.uint8).astype(bool)] = WALL
+        return classes.reshape(self.height, self.width)
+
+
+def read_export(filename: str) -> Dict[str, np.ndarray]:
+    with np.load(filename) as data:
+        height, width = data["shape"].tolist()
+        explored = np.unpackbits(data["explored"], count=height * width)
+        return {
+            "shape": (height, width),
+            "path": data["path"],
+            "explored": explored.astype(bool).reshape(height, width)
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Solve a maze.")
+    parser.add_argument("filename", help="maze .txt file")
+    parser.add_argument(
+        "--strategy",
+        choices=sorted(STRATEGIES) + ["all"],
+        default="bfs",
+        help="search strategy, or all to compare every strategy"
+    )
+    parser.add_argument(
+        "--table-size",
+        type=int,
+        default=TABLE_SIZE,
+        help="transposition table entries for idastar (0 disables it)"
+    )
+    parser.add_argument(
+        "--weight",
+        type=float,
+        default=WEIGHT,
+        help="heuristic weight for wastar"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=WORKERS,
+        help="worker processes for pbfs"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=int,
+        help="smallest level pbfs splits (default %d cells per worker)" % CELLS_PER_WORKER
+    )
+    parser.add_argument(
+        "--landmarks",
+        type=int,
+        default=LANDMARKS,
+        help="landmarks preprocessed for alt"
+    )
+    parser.add_argument(
+        "--mmap",
+        action="store_true",
+        help="memory-map the maze file while reading it"
+    )
+    parser.add_argument("--output", default="images", help="image directory")
+    parser.add_argument(
+        "--distances",
+        action="store_true",
+        help="also render the distance from the start to every cell"
+    )
+    parser.add_argument(
+        "--export",
+        metavar="FILE",
+        help="save the solution path and explored cells as a .npz file"
+    )
+    parser.add_argument(
+        "--print-to",
+        metavar="FILE",
+        help="write the solved maze as text to FILE instead of the terminal"
+    )
+    parser.add_argument(
+        "--stats",
+        choices=["json"],
+        help="print search counters and timings in the given format"
+    )
+    parser.add_argument(
+        "--cell-size",
+        type=int,
+        help="pixels per maze cell in images (default: fit in %d pixels)" % IMAGE_SIZE
+    )
+    args = parser.parse_args()
+
+    basename = os.path.basename(args.filename)
+    name, extension = os.path.splitext(basename)
+
+    if extension != ".txt":
+        print("Extension not supported.")
+        sys.exit(1)
+
+    try:
+        if args.strategy == "all":
+            compare(args.filename, args)
+            return
+        maze = Maze(args.filename, use_mmap=args.mmap)
+    except FileNotFoundError:
+        print("File not found: %s" % args.filename)
+        sys.exit(1)
+    if not args.print_to:
+        print("Maze:")
+        maze.print()
+    os.makedirs(args.output, exist_ok=True)
+    prefix = os.path.join(args.output, name)
+    maze.output_image(prefix + ".png", cell_size=args.cell_size)
+
+    print("Solving...")
+    stats = SearchStats() if args.stats else None
+    maze.solve(args.strategy, stats=stats, **strategy_options(args))
+    if stats is not None:
+        print(json.dumps(stats.as_dict()))
+
+    if maze.path is None:
+        print("No solution.")
+        sys.exit(1)
+
+    if args.print_to:
+        with open(args.print_to, "w") as file:
+            maze.print(file)
+    else:
+        print("Solution:")
+        maze.print()
+    prefix += "_" + args.strategy
+    maze.output_image(prefix + "_solution.png", cell_size=args.cell_size)
+    maze.output_image(
+        prefix + "_explored.png",
+        show_explored=True,
+        cell_size=args.cell_size
+    )
+    print("States Explored:", maze.num_explored)
+    if maze.weighted:
+        print("Path Cost:", maze.path_cost())
+
+    if args.distances:
+        distances, _ = maze.distance_field()
+        maze.output_distance_image(
+            os.path.join(args.output, name + "_distances.png"),
+            distances,
+            cell_size=args.cell_size
+        )
+
+    if args.export:
+        maze.export(args.export)
+
+
+def strategy_options(args: argparse.Namespace, strategy: str = None) -> dict:
+    strategy = strategy or args.strategy
+    if strategy == "idastar":
+        return {"table_size": args.table_size}
+    if strategy == "alt":
+        return {"landmarks": args.landmarks}
+    if strategy == "wastar":
+        return {"weight": args.weight}
+    if strategy == "pbfs":
+        return {"workers": args.workers, "threshold": args.threshold}
+    return {}
+
+
+def compare(filename: str, args: argparse.Namespace) -> None:
+    maze = Maze(filename)
+    print("%-12s %8s %8s %10s %10s" % (
+        "strategy", "length", "cost", "explored", "seconds"))
+    all_stats = []
+    for strategy in sorted(STRATEGIES):
+        if maze.weighted and strategy in UNIT_COST_STRATEGIES:
+            continue
+        stats = SearchStats() if args.stats else None
+        start = time.perf_counter()
+        maze.solve(strategy, stats=stats, **strategy_options(args, strategy))
+        elapsed = time.perf_counter() - start
+        if stats is not None:
+            all_stats.append(stats.as_dict())
+
+        length = len(maze.path) if maze.path is not None else None
+        print("%-12s %8s %8s %10d %10.4f" % (
+            strategy, length, maze.path_cost(), maze.num_explored, elapsed))
+
+    if args.stats:
+        print(json.dumps(all_stats))
+
+
+if __name__ == "__main__":
+    main()
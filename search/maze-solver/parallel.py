@@ -0,0 +1,172 @@
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+import numpy as np
+from tour import leg
+from util import Result, SearchStats
+
+WORKERS = os.cpu_count() or 1
+# Levels with fewer than this many cells per worker are expanded by the
+# coordinating process, where handing them to the pool would cost more than
+# expanding them. Breadth-first levels in a grid are only about as wide as
+# its side, so the default threshold grows with the pool rather than being
+# fixed.
+CELLS_PER_WORKER = 64
+
+NO_PARENT = -1
+
+
+class SharedGrid:
+    """The wall grid, visited bitmap and parent of every cell, laid out in
+    shared memory so every worker process expands cells in the same arrays.
+    """
+
+    def __init__(
+        self,
+        names: Tuple[str, str, str],
+        height: int,
+        width: int,
+        create: bool = False
+    ) -> None:
+        size = height * width
+        self.height = height
+        self.width = width
+        self.blocks: List[shared_memory.SharedMemory] = [
+            shared_memory.SharedMemory(name=name, create=create, size=nbytes)
+            for name, nbytes in zip(names, (size, size, size * 8))
+        ]
+        walls, visited, parents = self.blocks
+        self.walls = np.ndarray(size, dtype=np.uint8, buffer=walls.buf)
+        self.visited = np.ndarray(size, dtype=np.uint8, buffer=visited.buf)
+        self.parents = np.ndarray(size, dtype=np.int64, buffer=parents.buf)
+
+    @classmethod
+    def create(cls, maze) -> "SharedGrid":
+        prefix = "maze-%d-%s" % (os.getpid(), os.urandom(4).hex())
+        names = tuple(
+            "%s-%s" % (prefix, part) for part in ("walls", "visited", "parents")
+        )
+        grid = cls(names, maze.height, maze.width, create=True)
+        grid.walls[:] = np.frombuffer(maze.walls, dtype=np.uint8)
+        grid.visited[:] = 0
+        grid.parents[:] = NO_PARENT
+        return grid
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return tuple(block.name for block in self.blocks)
+
+    def close(self, unlink: bool = False) -> None:
+        # The arrays must go before the buffers they view can be released.
+        del self.walls, self.visited, self.parents
+        for block in self.blocks:
+            block.close()
+            if unlink:
+                block.unlink()
+
+
+# The grid each worker process attached to when it started.
+_grid: Optional[SharedGrid] = None
+
+
+def _attach(names: Tuple[str, str, str], height: int, width: int) -> None:
+    global _grid
+    _grid = SharedGrid(names, height, width)
+
+
+def _expand_shared(frontier: np.ndarray) -> np.ndarray:
+    return expand(_grid, frontier)
+
+
+def expand(grid: SharedGrid, frontier: np.ndarray) -> np.ndarray:
+    # Claims every open, unvisited neighbor of the frontier cells. Workers
+    # sharing a level may claim the same cell; either parent is on the
+    # previous level, so whichever write lands last is still a shortest path.
+    rows, cols = np.divmod(frontier, grid.width)
+    parents = []
+    children = []
+    for inside, offset in (
+        (rows > 0, -grid.width),
+        (rows < grid.height - 1, grid.width),
+        (cols > 0, -1),
+        (cols < grid.width - 1, 1)
+    ):
+        parents.append(frontier[inside])
+        children.append(frontier[inside] + offset)
+
+    parents = np.concatenate(parents)
+    children = np.concatenate(children)
+    new = (grid.walls[children] == 0) & (grid.visited[children] == 0)
+    parents, children = parents[new], children[new]
+
+    children, first = np.unique(children, return_index=True)
+    grid.visited[children] = 1
+    grid.parents[children] = parents[first]
+    return children
+
+
+def parallel_breadth_first(
+    maze,
+    workers: int = WORKERS,
+    threshold: Optional[int] = None,
+    stats: Optional[SearchStats] = None
+) -> Result:
+    start = maze.index(maze.start)
+    goal = maze.index(maze.goal)
+    if threshold is None:
+        threshold = CELLS_PER_WORKER * workers
+    grid = SharedGrid.create(maze)
+    try:
+        grid.visited[start] = 1
+        if workers > 1:
+            context = multiprocessing.get_context()
+            with context.Pool(
+                workers,
+                initializer=_attach,
+                initargs=(grid.names, grid.height, grid.width)
+            ) as pool:
+                levels = search_levels(grid, start, goal, pool, workers, threshold)
+        else:
+            levels = search_levels(grid, start, goal, None, 1, threshold)
+
+        num_explored, parallel_levels, widest = levels
+        if stats is not None:
+            stats.parallel_levels = parallel_levels
+            stats.peak_frontier = widest
+
+        explored = np.flatnonzero(grid.visited)
+        if not grid.visited[goal]:
+            return Result(None, explored, num_explored)
+        return Result(leg(maze, grid.parents, start, goal), explored, num_explored)
+    finally:
+        grid.close(unlink=True)
+
+
+def search_levels(
+    grid: SharedGrid,
+    start: int,
+    goal: int,
+    pool,
+    workers: int,
+    threshold: int
+) -> Tuple[int, int, int]:
+    frontier = np.array([start], dtype=np.int64)
+    num_explored = 0
+    parallel_levels = 0
+    widest = 0
+
+    # Level-synchronous: the whole frontier is expanded before the next level
+    # starts, so the first level that reaches the goal gives a shortest path.
+    while len(frontier) and not grid.visited[goal]:
+        num_explored += len(frontier)
+        widest = max(widest, len(frontier))
+        if pool is None or len(frontier) < threshold:
+            frontier = expand(grid, frontier)
+        else:
+            parallel_levels += 1
+            chunks = np.array_split(frontier, workers)
+            levels = pool.map(_expand_shared, chunks)
+            frontier = np.unique(np.concatenate(levels))
+    return num_explored, parallel_levels, widest
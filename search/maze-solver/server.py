@@ -0,0 +1,176 @@
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import sys
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from maze import Maze
+from strategies import STRATEGIES
+from util import State
+
+CACHE_SIZE = 32
+
+
+class MazeCache:
+    def __init__(self, capacity: int = CACHE_SIZE) -> None:
+        self.capacity = capacity
+        # Parsed mazes and their file endpoints, least recently used first.
+        self.mazes: OrderedDict[str, Tuple[Maze, State, List[State]]] = OrderedDict()
+        # Digest of each file as of its last seen modification time and size.
+        self.digests: Dict[str, Tuple[int, int, str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, filename: str) -> Tuple[Maze, State, List[State]]:
+        digest = self._digest(filename)
+        if digest in self.mazes:
+            self.hits += 1
+            self.mazes.move_to_end(digest)
+            return self.mazes[digest]
+
+        self.misses += 1
+        maze = Maze(filename)
+        self.mazes[digest] = (maze, maze.start, maze.goals)
+        if len(self.mazes) > self.capacity:
+            self.mazes.popitem(last=False)
+        return self.mazes[digest]
+
+    def _digest(self, filename: str) -> str:
+        status = os.stat(filename)
+        seen = self.digests.get(filename)
+        if seen is not None and seen[:2] == (status.st_mtime_ns, status.st_size):
+            return seen[2]
+
+        digest = hashlib.sha256()
+        with open(filename, "rb") as file:
+            for block in iter(lambda: file.read(1 << 20), b""):
+                digest.update(block)
+        self.digests[filename] = (
+            status.st_mtime_ns,
+            status.st_size,
+            digest.hexdigest()
+        )
+        return digest.hexdigest()
+
+
+class MazeServer:
+    def __init__(self, cache_size: int = CACHE_SIZE) -> None:
+        self.cache = MazeCache(cache_size)
+
+    def handle(self, line: str) -> Dict:
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            response = self.solve(request)
+        except Exception as error:
+            response = {"error": str(error)}
+        response["id"] = request_id
+        return response
+
+    def solve(self, request: Dict) -> Dict:
+        strategy = request.get("strategy", "bfs")
+        if strategy not in STRATEGIES:
+            raise ValueError("Unknown strategy: %s" % strategy)
+
+        hits = self.cache.hits
+        maze, start, goals = self.cache.get(request["maze"])
+        if "goal" in request and "goals" in request:
+            raise ValueError("Request has both goal and goals.")
+        if "goal" in request:
+            goals = [self._state(request["goal"], None)]
+        elif "goals" in request:
+            if not request["goals"]:
+                raise ValueError("Request has an empty goals list.")
+            goals = [self._state(goal, None) for goal in request["goals"]]
+        maze.set_endpoints(self._state(request.get("start"), start), goals[0], goals)
+
+        begin = time.perf_counter()
+        maze.solve(strategy, **request.get("options", {}))
+        seconds = time.perf_counter() - begin
+
+        response = {
+            "strategy": strategy,
+            "num_explored": maze.num_explored,
+            "seconds": round(seconds, 6),
+            "cached": self.cache.hits > hits
+        }
+        if maze.path is None:
+            response.update(path=None, actions=None, length=None)
+        else:
+            rows, cols = np.divmod(maze.path, maze.width)
+            response.update(
+                path=np.column_stack((rows, cols)).tolist(),
+                actions=maze.actions,
+                length=len(maze.path)
+            )
+        return response
+
+    def _state(self, cell: Optional[list], default: State) -> State:
+        if cell is None:
+            return default
+        row, col = cell
+        return State(int(row), int(col))
+
+
+async def serve_stdio(server: MazeServer) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        line = await loop.run_in_executor(None, sys.stdin.readline)
+        if not line:
+            return
+        if line.strip():
+            sys.stdout.write(json.dumps(server.handle(line)) + "\n")
+            sys.stdout.flush()
+
+
+async def serve_socket(server: MazeServer, path: str) -> None:
+    async def handle_client(reader, writer) -> None:
+        try:
+            while line := await reader.readline():
+                if line.strip():
+                    response = server.handle(line.decode())
+                    writer.write(json.dumps(response).encode() + b"\n")
+                    await writer.drain()
+        finally:
+            writer.close()
+
+    unix_server = await asyncio.start_unix_server(handle_client, path=path)
+    async with unix_server:
+        await unix_server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Answer maze queries given as JSON lines."
+    )
+    parser.add_argument(
+        "--socket",
+        metavar="PATH",
+        help="listen on a Unix socket instead of stdin and stdout"
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=CACHE_SIZE,
+        help="parsed mazes kept in memory"
+    )
+    args = parser.parse_args()
+
+    server = MazeServer(args.cache_size)
+    try:
+        if args.socket:
+            asyncio.run(serve_socket(server, args.socket))
+        else:
+            asyncio.run(serve_stdio(server))
+    except KeyboardInterrupt:
+        sys.exit("Server stopped.")
+
+
+if __name__ == "__main__":
+    main()
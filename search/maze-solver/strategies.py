@@ -0,0 +1,237 @@
+import time
+from typing import Callable, Dict, List, Optional, Set
+from bidirectional import bidirectional_a_star, bidirectional_breadth_first
+from idastar import iterative_deepening_a_star
+from jps import jump_point_search
+from landmarks import (
+    CACHE_DIRECTORY,
+    LANDMARKS,
+    alt_heuristic,
+    landmark_distances
+)
+from lpastar import lifelong_a_star
+from parallel import parallel_breadth_first
+from tour import waypoint_tour
+from util import (
+    GreedyFrontier,
+    Node,
+    PriorityFrontier,
+    QueueFrontier,
+    Result,
+    SearchStats,
+    StackFrontier
+)
+
+STRATEGIES: Dict[str, Callable] = {}
+# Strategies that assume every step costs 1.
+UNIT_COST_STRATEGIES = {"biastar", "idastar", "jps", "tour"}
+# Strategies that accept a stats argument. All but pbfs fill in every counter.
+INSTRUMENTED_STRATEGIES = {
+    "alt",
+    "astar",
+    "bfs",
+    "dfs",
+    "dijkstra",
+    "greedy",
+    "nearest",
+    "pbfs",
+    "wastar"
+}
+
+WEIGHT = 2.0
+
+
+def register(name: str) -> Callable:
+    def decorator(solver: Callable) -> Callable:
+        STRATEGIES[name] = solver
+        return solver
+    return decorator
+
+
+def frontier_search(
+    maze,
+    frontier,
+    stats: Optional[SearchStats] = None,
+    goals: Optional[Set[int]] = None
+) -> Result:
+    if goals is None:
+        goals = {maze.index(maze.goal)}
+    if stats is not None:
+        return instrumented_search(maze, frontier, stats, goals)
+
+    start = maze.index(maze.start)
+    frontier.add(Node(state=start, parent=None, action=None))
+
+    explored = set()
+    num_explored = 0
+
+    while not frontier.empty():
+        node = frontier.remove()
+        num_explored += 1
+
+        if node.state in goals:
+            return Result(reconstruct_path(node), explored, num_explored)
+
+        explored.add(node.state)
+
+        for name, state in maze.neighbors(node.state):
+            if state not in explored:
+                child = Node(
+                    state=state,
+                    parent=node,
+                    action=name,
+                    step_cost=maze.cost(state)
+                )
+                frontier.add(child)
+
+    return Result(None, explored, num_explored)
+
+
+def instrumented_search(
+    maze,
+    frontier,
+    stats: SearchStats,
+    goals: Set[int]
+) -> Result:
+    # The same loop as frontier_search, kept separate so that solving without
+    # stats pays nothing for the counters and clock reads.
+    clock = time.perf_counter
+    on_expand = stats.on_expand
+    start = maze.index(maze.start)
+    frontier.add(Node(state=start, parent=None, action=None))
+
+    explored = set()
+    num_explored = 0
+    generated = 1
+    duplicates = 0
+    peak_frontier = 1
+    frontier_seconds = neighbor_seconds = 0.0
+    path = None
+
+    while not frontier.empty():
+        began = clock()
+        node = frontier.remove()
+        frontier_seconds += clock() - began
+        num_explored += 1
+        if on_expand is not None:
+            on_expand(node)
+
+        if node.state in goals:
+            path = reconstruct_path(node)
+            break
+
+        explored.add(node.state)
+
+        began = clock()
+        neighbors = maze.neighbors(node.state)
+        neighbor_seconds += clock() - began
+
+        for name, state in neighbors:
+            if state in explored:
+                duplicates += 1
+                continue
+            child = Node(
+                state=state,
+                parent=node,
+                action=name,
+                step_cost=maze.cost(state)
+            )
+            generated += 1
+            began = clock()
+            if not frontier.add(child):
+                duplicates += 1
+            frontier_seconds += clock() - began
+        peak_frontier = max(peak_frontier, len(frontier))
+
+    stats.generated = generated
+    stats.expanded = num_explored
+    stats.duplicates = duplicates
+    stats.peak_frontier = peak_frontier
+    stats.frontier_seconds = frontier_seconds
+    stats.neighbor_seconds = neighbor_seconds
+    return Result(path, explored, num_explored)
+
+
+def reconstruct_path(node: Node):
+    cells: List[int] = []
+    actions: List[str] = []
+
+    while node.parent is not None:
+        cells.append(node.state)
+        actions.append(node.action)
+        node = node.parent
+
+    cells.reverse()
+    actions.reverse()
+    return cells, actions
+
+
+@register("bfs")
+def breadth_first(maze, stats: Optional[SearchStats] = None) -> Result:
+    return frontier_search(maze, QueueFrontier(), stats)
+
+
+@register("dfs")
+def depth_first(maze, stats: Optional[SearchStats] = None) -> Result:
+    return frontier_search(maze, StackFrontier(), stats)
+
+
+@register("greedy")
+def greedy_best_first(maze, stats: Optional[SearchStats] = None) -> Result:
+    return frontier_search(maze, GreedyFrontier(maze.heuristic()), stats)
+
+
+@register("astar")
+def a_star(maze, stats: Optional[SearchStats] = None) -> Result:
+    return frontier_search(maze, PriorityFrontier(maze.heuristic()), stats)
+
+
+@register("dijkstra")
+def dijkstra(maze, stats: Optional[SearchStats] = None) -> Result:
+    return frontier_search(maze, PriorityFrontier(lambda cell: 0), stats)
+
+
+@register("wastar")
+def weighted_a_star(
+    maze,
+    weight: float = WEIGHT,
+    stats: Optional[SearchStats] = None
+) -> Result:
+    # Inflating the heuristic trades optimality (within a factor of weight)
+    # for fewer expansions.
+    heuristic = maze.heuristic()
+    return frontier_search(
+        maze,
+        PriorityFrontier(lambda cell: weight * heuristic(cell)),
+        stats
+    )
+
+
+@register("nearest")
+def nearest_goal(maze, stats: Optional[SearchStats] = None) -> Result:
+    # One search that stops at whichever goal it reaches first, which is the
+    # nearest: breadth-first on plain mazes, uniform-cost on weighted ones.
+    frontier = PriorityFrontier(lambda cell: 0) if maze.weighted else QueueFrontier()
+    goals = {maze.index(goal) for goal in maze.goals}
+    return frontier_search(maze, frontier, stats, goals)
+
+
+@register("alt")
+def landmark_a_star(
+    maze,
+    landmarks: int = LANDMARKS,
+    cache_directory: str = CACHE_DIRECTORY,
+    stats: Optional[SearchStats] = None
+) -> Result:
+    tables = landmark_distances(maze, landmarks, cache_directory)
+    frontier = PriorityFrontier(alt_heuristic(maze, tables))
+    return frontier_search(maze, frontier, stats)
+
+
+register("bibfs")(bidirectional_breadth_first)
+register("biastar")(bidirectional_a_star)
+register("jps")(jump_point_search)
+register("idastar")(iterative_deepening_a_star)
+register("lpastar")(lifelong_a_star)
+register("tour")(waypoint_tour)
+register("pbfs")(parallel_breadth_first)
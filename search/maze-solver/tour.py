@@ -0,0 +1,139 @@
+from itertools import combinations
+from typing import Dict, List, Set, Tuple
+
+import numpy as np
+from distances import UNREACHABLE, distance_field
+from util import Result
+
+# Waypoint counts up to which the visiting order is solved exactly.
+HELD_KARP_LIMIT = 10
+
+Fields = Dict[int, Tuple[np.ndarray, np.ndarray]]
+
+
+def waypoint_tour(maze) -> Result:
+    start = maze.index(maze.start)
+    waypoints = list(dict.fromkeys(maze.index(goal) for goal in maze.goals))
+    stops = [start] + [cell for cell in waypoints if cell != start]
+
+    fields, explored = cached_distance_fields(maze, stops)
+    num_explored = len(explored)
+
+    # Pairwise distances between the start (stop 0) and every waypoint.
+    matrix = [[int(fields[a][0][b]) for b in stops] for a in stops]
+    if any(UNREACHABLE in row for row in matrix):
+        return Result(None, explored, num_explored)
+
+    cells: List[int] = []
+    actions: List[str] = []
+    order = visiting_order(matrix)
+    for a, b in zip(order, order[1:]):
+        leg_cells, leg_actions = leg(maze, fields[stops[a]][1], stops[a], stops[b])
+        cells.extend(leg_cells)
+        actions.extend(leg_actions)
+    return Result((cells, actions), explored, num_explored)
+
+
+def cached_distance_fields(maze, sources: List[int]) -> Tuple[Fields, Set[int]]:
+    digest = maze.digest()
+    if maze.distance_cache is None or maze.distance_cache[0] != digest:
+        maze.distance_cache = (digest, {})
+    cache = maze.distance_cache[1]
+
+    # Only the fields computed now count as explored.
+    explored: Set[int] = set()
+    for source in sources:
+        if source not in cache:
+            cache[source] = distance_field(maze, source)
+            explored.update(np.flatnonzero(cache[source][0] != UNREACHABLE).tolist())
+    return {source: cache[source] for source in sources}, explored
+
+
+def visiting_order(matrix: List[List[int]]) -> List[int]:
+    # Orders stops 1..n after the fixed first stop 0 to minimize the total
+    # distance, without returning to the start.
+    if len(matrix) == 1:
+        # Every goal is the start: the tour is empty.
+        return [0]
+    if len(matrix) - 1 <= HELD_KARP_LIMIT:
+        return held_karp(matrix)
+    return two_opt(matrix, nearest_neighbor(matrix))
+
+
+def held_karp(matrix: List[List[int]]) -> List[int]:
+    stops = len(matrix) - 1
+    # best[(visited, last)]: shortest walk from stop 0 through the stops in
+    # the bitmask visited, ending at last, and the stop before last.
+    best: Dict[Tuple[int, int], Tuple[int, int]] = {
+        (1 << (stop - 1), stop): (matrix[0][stop], 0)
+        for stop in range(1, stops + 1)
+    }
+    for size in range(2, stops + 1):
+        for subset in combinations(range(1, stops + 1), size):
+            visited = sum(1 << (stop - 1) for stop in subset)
+            for last in subset:
+                previous_visited = visited & ~(1 << (last - 1))
+                best[(visited, last)] = min(
+                    (best[(previous_visited, before)][0] + matrix[before][last], before)
+                    for before in subset
+                    if before != last
+                )
+
+    everything = (1 << stops) - 1
+    last = min(range(1, stops + 1), key=lambda stop: best[(everything, stop)][0])
+    order = [0] * (stops + 1)
+    visited = everything
+    for position in range(stops, 0, -1):
+        order[position] = last
+        visited, last = visited & ~(1 << (last - 1)), best[(visited, last)][1]
+    return order
+
+
+def nearest_neighbor(matrix: List[List[int]]) -> List[int]:
+    order = [0]
+    remaining = set(range(1, len(matrix)))
+    while remaining:
+        closest = min(remaining, key=lambda stop: matrix[order[-1]][stop])
+        order.append(closest)
+        remaining.remove(closest)
+    return order
+
+
+def two_opt(matrix: List[List[int]], order: List[int]) -> List[int]:
+    # Reverses segments of the order while that shortens the walk.
+    improved = True
+    while improved:
+        improved = False
+        for i in range(1, len(order) - 1):
+            for j in range(i + 1, len(order)):
+                before = matrix[order[i - 1]][order[i]]
+                after = matrix[order[i - 1]][order[j]]
+                if j + 1 < len(order):
+                    before += matrix[order[j]][order[j + 1]]
+                    after += matrix[order[i]][order[j + 1]]
+                if after < before:
+                    order[i:j + 1] = reversed(order[i:j + 1])
+                    improved = True
+    return order
+
+
+def leg(
+    maze,
+    predecessors: np.ndarray,
+    source: int,
+    target: int
+) -> Tuple[List[int], List[str]]:
+    cells: List[int] = []
+    actions: List[str] = []
+    cell = target
+    while cell != source:
+        previous = int(predecessors[cell])
+        cells.append(cell)
+        actions.append(next(
+            name for name, neighbor in maze.neighbors(previous) if neighbor == cell
+        ))
+        cell = previous
+
+    cells.reverse()
+    actions.reverse()
+    return cells, actions
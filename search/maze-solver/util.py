@@ -0,0 +1,203 @@
+import heapq
+from collections import deque
+from itertools import count
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple
+
+
+class State:
+    __slots__ = ("_items",)
+
+    def __init__(self, row: int, column: int):
+        self._items = (row, column)
+
+    def __getitem__(self, index: int) -> int:
+        return self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return repr(self._items)
+
+    def __iter__(self) -> iter:
+        return iter(self._items)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, State):
+            return self._items == other._items
+        return False
+
+    def __hash__(self) -> int:
+        return hash(self._items)
+
+
+class Node:
+    __slots__ = ("state", "parent", "action", "cost")
+
+    def __init__(
+        self,
+        state: int,
+        parent: Optional['Node'],
+        action: str,
+        step_cost: int = 1
+    ) -> None:
+        self.state = state
+        self.parent = parent
+        self.action = action
+        self.cost = 0 if parent is None else parent.cost + step_cost
+
+
+class Result:
+    __slots__ = ("path", "explored", "num_explored")
+
+    def __init__(
+        self,
+        path: Optional[Tuple[List[int], List[str]]],
+        explored: Set[int],
+        num_explored: int
+    ) -> None:
+        self.path = path
+        self.explored = explored
+        self.num_explored = num_explored
+
+
+class SearchStats:
+    """Counters and timings filled in by an instrumented search.
+
+    Strategies that do not run through frontier_search only report the
+    states expanded and the total time; the other counters stay None.
+    pbfs also reports its widest level as peak_frontier, and how many
+    levels it handed to its workers as parallel_levels.
+    """
+
+    __slots__ = (
+        "strategy",
+        "generated",
+        "expanded",
+        "duplicates",
+        "peak_frontier",
+        "frontier_seconds",
+        "neighbor_seconds",
+        "total_seconds",
+        "parallel_levels",
+        "on_expand"
+    )
+
+    def __init__(self, on_expand: Optional[Callable[[Node], None]] = None) -> None:
+        self.strategy: Optional[str] = None
+        self.generated: Optional[int] = None
+        self.expanded: Optional[int] = None
+        self.duplicates: Optional[int] = None
+        self.peak_frontier: Optional[int] = None
+        self.frontier_seconds: Optional[float] = None
+        self.neighbor_seconds: Optional[float] = None
+        self.total_seconds: Optional[float] = None
+        self.parallel_levels: Optional[int] = None
+        # Called with each node as it is removed from the frontier.
+        self.on_expand = on_expand
+
+    def as_dict(self) -> Dict:
+        return {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if name != "on_expand"
+        }
+
+
+class StackFrontier:
+    def __init__(self):
+        self.frontier: List[Node] = []
+        self.states: Set[int] = set()
+
+    def add(self, node: Node) -> bool:
+        if node.state in self.states:
+            return False
+        self.frontier.append(node)
+        self.states.add(node.state)
+        return True
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def contains_state(self, state) -> bool:
+        return state in self.states
+
+    def empty(self) -> bool:
+        return len(self.frontier) == 0
+
+    def remove(self) -> Node:
+        if self.empty():
+            raise Exception("Empty frontier.")
+        else:
+            node = self.frontier.pop()
+            self.states.discard(node.state)
+            return node
+
+
+class QueueFrontier(StackFrontier):
+    def __init__(self):
+        self.frontier: Deque[Node] = deque()
+        self.states: Set[int] = set()
+
+    def remove(self) -> Node:
+        if self.empty():
+            raise Exception("Empty frontier.")
+        else:
+            node = self.frontier.popleft()
+            self.states.discard(node.state)
+            return node
+
+
+class PriorityFrontier:
+    def __init__(self, heuristic: Callable[[int], int]):
+        self.heuristic = heuristic
+        self.frontier: List[Tuple[int, int, Node]] = []
+        self.costs: Dict[int, int] = {}
+        self.counter = count()
+
+    def add(self, node: Node) -> bool:
+        cost = self.costs.get(node.state)
+        if cost is not None and cost <= node.cost:
+            return False
+        # A cheaper path supersedes the queued entry, which is skipped on removal.
+        self.costs[node.state] = node.cost
+        priority = self._priority(node)
+        heapq.heappush(self.frontier, (priority, next(self.counter), node))
+        return True
+
+    def __len__(self) -> int:
+        return len(self.costs)
+
+    def contains_state(self, state) -> bool:
+        return state in self.costs
+
+    def empty(self) -> bool:
+        return len(self.costs) == 0
+
+    def remove(self) -> Node:
+        if self.empty():
+            raise Exception("Empty frontier.")
+        while True:
+            _, _, node = heapq.heappop(self.frontier)
+            if self._is_stale(node):
+                continue
+            del self.costs[node.state]
+            return node
+
+    def _is_stale(self, node: Node) -> bool:
+        return self.costs.get(node.state) != node.cost
+
+    def _priority(self, node: Node) -> int:
+        return node.cost + self.heuristic(node.state)
+
+
+class GreedyFrontier(PriorityFrontier):
+    def add(self, node: Node) -> bool:
+        # The heuristic alone orders the frontier, so the first path to a
+        # state is kept, as in the greedy best-first walkthrough.
+        if node.state in self.costs:
+            return False
+        return super().add(node)
+
+    def _priority(self, node: Node) -> int:
+        return self.heuristic(node.state)
@@ -0,0 +1,114 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import List, Tuple
+from unittest import mock
+
+import maze
+from maze import Maze
+from util import Node, QueueFrontier
+
+
+class ListQueueFrontier(QueueFrontier):
+    def __init__(self):
+        super().__init__()
+        self.frontier: List[Node] = []
+
+    def remove(self) -> Node:
+        if self.empty():
+            raise Exception("Empty frontier.")
+        node = self.frontier.pop(0)
+        self.states.discard(node.state)
+        return node
+
+
+class DictNode:
+    def __init__(self, state: int, parent, action: str) -> None:
+        self.state = state
+        self.parent = parent
+        self.action = action
+
+
+def generate_open_grid(size: int) -> str:
+    rows = ["#" * size]
+    rows += ["#" + " " * (size - 2) + "#" for _ in range(size - 2)]
+    rows.append("#" * size)
+    rows[1] = "#A" + rows[1][2:]
+    rows[-2] = rows[-2][:-2] + "B#"
+    return "\n".join(rows)
+
+
+def measure(filename: str, frontier: type) -> Tuple[int, float]:
+    with mock.patch.object(maze, "QueueFrontier", frontier):
+        solver = Maze(filename)
+        start = time.perf_counter()
+        solver.solve()
+        elapsed = time.perf_counter() - start
+    return solver.num_explored, elapsed
+
+
+def measure_memory(filename: str, node: type) -> int:
+    with mock.patch.object(maze, "Node", node):
+        solver = Maze(filename)
+        tracemalloc.start()
+        solver.solve()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return peak
+
+
+def compare_throughput(directory: str, sizes: List[int]) -> None:
+    print("%6s %10s %14s %14s %8s" % (
+        "size", "explored", "list nodes/s", "deque nodes/s", "speedup"))
+    for size in sizes:
+        filename = write_grid(directory, size)
+
+        explored, list_time = measure(filename, ListQueueFrontier)
+        _, deque_time = measure(filename, QueueFrontier)
+
+        print("%6d %10d %14.0f %14.0f %7.1fx" % (
+            size,
+            explored,
+            explored / list_time,
+            explored / deque_time,
+            list_time / deque_time
+        ))
+
+
+def compare_memory(directory: str, sizes: List[int]) -> None:
+    print("%6s %14s %14s %8s" % (
+        "size", "dict peak MB", "slots peak MB", "saving"))
+    for size in sizes:
+        filename = write_grid(directory, size)
+
+        dict_peak = measure_memory(filename, DictNode)
+        slots_peak = measure_memory(filename, Node)
+
+        print("%6d %14.1f %14.1f %7.0f%%" % (
+            size,
+            dict_peak / 2 ** 20,
+            slots_peak / 2 ** 20,
+            100 * (1 - slots_peak / dict_peak)
+        ))
+
+
+def write_grid(directory: str, size: int) -> str:
+    filename = os.path.join(directory, "grid%d.txt" % size)
+    with open(filename, "w") as file:
+        file.write(generate_open_grid(size))
+    return filename
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100, 200, 400]
+
+    with tempfile.TemporaryDirectory() as directory:
+        compare_throughput(directory, sizes)
+        print()
+        compare_memory(directory, sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,14 @@
 import os
 import sys
 from PIL import Image, ImageDraw
-from util import Node, StackFrontier, State, Action
+from util import Node, StackFrontier, State
 from typing import List, Set, Tuple
 
 
+# Maps "#" to 1 and every other byte to 0.
+WALL_TABLE = bytes(int(byte == ord("#")) for byte in range(256))
+
+
 class Maze:
     def __init__(self, filename: str) -> None:
         self._load_maze(filename)
@@ -16,15 +20,21 @@ class Maze:
         height, width = self._get_height_and_width()
         self.height: int = height
         self.width: int = width
+        self.offsets: Tuple[Tuple[str, int], ...] = (
+            ("up", -width),
+            ("down", width),
+            ("left", -1),
+            ("right", 1)
+        )
 
         start, goal, walls = self._get_start_goal_and_walls()
         self.start: State = start
         self.goal: State = goal
-        self.walls: List[List[bool]] = walls
+        self.walls: bytearray = walls
 
-        self.explored: Set[State] = None
+        self.explored: Set[int] = None
         self.num_explored: int = 0
-        self.solution: Tuple[List[State], List[Action]] = None
+        self.solution: Tuple[List[State], List[str]] = None
 
     def _get_maze(self, filename: str) -> str:
         maze = self._read(filename)
@@ -63,32 +73,34 @@ class Maze:
         width = max(len(line) for line in self.lines)
         return height, width
 
-    def _get_start_goal_and_walls(self) -> Tuple[State, State, List]:
-        walls = []
+    def _get_start_goal_and_walls(self) -> Tuple[State, State, bytearray]:
+        walls = bytearray(self.height * self.width)
         start = goal = None
-        for i in range(self.height):
-            row = []
-            for j in range(self.width):
-                try:
-                    cell = self.lines[i][j]
-                except IndexError:
-                    row.append(False)
-                else:
-                    if cell == "A":
-                        start = State(i, j)
-                    if cell == "B":
-                        goal = State(i, j)
-                    row.append(cell == "#")
-            walls.append(row)
+        for i, line in enumerate(self.lines):
+            offset = i * self.width
+            cells = line.encode("ascii", "replace")
+            walls[offset:offset + len(cells)] = cells.translate(WALL_TABLE)
+            if "A" in line:
+                start = State(i, line.index("A"))
+            if "B" in line:
+                goal = State(i, line.index("B"))
         return start, goal, walls
 
+    def _index(self, state: State) -> int:
+        row, col = state
+        return row * self.width + col
+
+    def _state(self, index: int) -> State:
+        return State(*divmod(index, self.width))
+
     def solve(self) -> None:
-        start = Node(state=self.start, parent=None, action=None)
+        start = Node(state=self._index(self.start), parent=None, action=None)
         frontier = StackFrontier()
         frontier.add(start)
 
         self.explored = set()
         self.num_explored = 0
+        goal = self._index(self.goal)
 
         while True:
             if frontier.empty():
@@ -98,12 +110,12 @@ class Maze:
             node = frontier.remove()
             self.num_explored += 1
 
-            if node.state == self.goal:
+            if node.state == goal:
                 states: List[State] = []
-                actions: List[Action] = []
+                actions: List[str] = []
 
                 while node.parent is not None:
-                    states.append(node.state)
+                    states.append(self._state(node.state))
                     actions.append(node.action)
                     node = node.parent
 
@@ -122,36 +134,21 @@ class Maze:
                     child = Node(state=state, parent=node, action=name)
                     frontier.add(child)
 
-    def _get_allowable_actions(self, state: State) -> List[Action]:
-        allowable_actions = []
-        for action in self._get_actions(state):
-            row, col = action.state
-
-            height_range = 0 <= row < self.height
-            width_range = 0 <= col < self.width
-
-            if height_range and width_range and not self.walls[row][col]:
-                allowable_actions.append(action)
-        return allowable_actions
-
-    def _get_actions(self, state: State) -> List[Action]:
-        row, col = state
-
-        actions = [
-            Action("up", State(row - 1, col)),
-            Action("down", State(row + 1, col)),
-            Action("left", State(row, col - 1)),
-            Action("right", State(row, col + 1))
+    def _get_allowable_actions(self, index: int) -> List[Tuple[str, int]]:
+        row, col = divmod(index, self.width)
+        inside = (row > 0, row < self.height - 1, col > 0, col < self.width - 1)
+        return [
+            (name, index + offset)
+            for (name, offset), is_inside in zip(self.offsets, inside)
+            if is_inside and not self.walls[index + offset]
         ]
 
-        return actions
-
     def print(self) -> None:
         print()
-        for i, row in enumerate(self.walls):
-            for j, is_wall in enumerate(row):
+        for i in range(self.height):
+            for j in range(self.width):
                 state = State(i, j)
-                if is_wall:
+                if self.walls[self._index(state)]:
                     print("█", end="")
                 elif self._is_start(state):
                     print("A", end="")
@@ -175,7 +172,7 @@ class Maze:
         return states is not None and state in states
 
     def _was_explored(self, state: State) -> bool:
-        return self.explored is not None and state in self.explored
+        return self.explored is not None and self._index(state) in self.explored
 
     def output_image(
         self,
@@ -193,10 +190,10 @@ class Maze:
         img = Image.new("RGBA", size, "black")
         draw = ImageDraw.Draw(img)
 
-        for i, row in enumerate(self.walls):
-            for j, is_wall in enumerate(row):
+        for i in range(self.height):
+            for j in range(self.width):
                 state = State(i, j)
-                if is_wall:
+                if self.walls[self._index(state)]:
                     fill = (40, 40, 40)  # RGB: Ebony
                 elif self._is_start(state):
                     fill = (255, 0, 0)  # RGB: Red
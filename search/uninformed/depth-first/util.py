@@ -1,7 +1,9 @@
-from typing import List, Optional
+from typing import List, Optional, Set
 
 
 class State:
+    __slots__ = ("_items",)
+
     def __init__(self, row: int, column: int):
         self._items = (row, column)
 
@@ -26,19 +28,12 @@ class State:
         return hash(self._items)
 
 
-class Action:
-    def __init__(self, name: str, state: State) -> None:
-        self.name = name
-        self.state = state
-
-    def __iter__(self) -> iter:
-        return iter((self.name, self.state))
-
-
 class Node:
+    __slots__ = ("state", "parent", "action")
+
     def __init__(
         self,
-        state: State,
+        state: int,
         parent: Optional['Node'],
         action: str
     ) -> None:
@@ -50,12 +45,14 @@ class Node:
 class StackFrontier:
     def __init__(self):
         self.frontier: List[Node] = []
+        self.states: Set[int] = set()
 
     def add(self, node: Node) -> None:
         self.frontier.append(node)
+        self.states.add(node.state)
 
-    def contains_state(self, state) -> None:
-        return any(node.state == state for node in self.frontier)
+    def contains_state(self, state) -> bool:
+        return state in self.states
 
     def empty(self) -> bool:
         return len(self.frontier) == 0
@@ -64,4 +61,6 @@ class StackFrontier:
         if self.empty():
             raise Exception("Empty frontier.")
         else:
-            return self.frontier.pop()
+            node = self.frontier.pop()
+            self.states.discard(node.state)
+            return node